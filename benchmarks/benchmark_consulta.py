@@ -0,0 +1,140 @@
+"""
+Mede a consulta completa sobre páginas gravadas (sem acesso à rede).
+
+Reproduz um arquivo gravado com `python -m consultor_uff ... --gravar ARQUIVO_ZIP`
+e mede consultas por minuto, páginas por segundo, tempo de análise do HTML e
+tempo de exportação de cada formato. As páginas podem ser servidas no próprio
+processo ou por um servidor HTTP local (que exercita conexões e novas tentativas),
+com latência e erros simulados.
+
+Uso:
+    python benchmarks/benchmark_consulta.py [ARQUIVO_ZIP] [--servidor] [--latencia 0.05] [--erro 0.02]
+
+Sem ARQUIVO_ZIP usa benchmarks/corpus/sintetico_2026_1.zip: páginas sintéticas, geradas
+no formato do quadro de horários (2 períodos, buscas paginadas e 120 turmas), não
+capturadas do app.uff.br. Por padrão repete a consulta dos metadados do arquivo.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from consultor_uff.analise import analisar_pagina_listagem, analisar_turma, escolher_parser  # noqa: E402
+from consultor_uff.consultor import ConsultorQuadroHorariosUFF  # noqa: E402
+from consultor_uff.exportacao import FORMATOS, exportar  # noqa: E402
+from consultor_uff.periodos import calcular_periodos_retroativos, normalizar_periodo  # noqa: E402
+from consultor_uff.reproducao import ArquivoPaginas, ServidorReproducao, reproduzir  # noqa: E402
+from consultor_uff.transporte import MAX_WORKERS_PADRAO  # noqa: E402
+
+CORPUS_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'sintetico_2026_1.zip')
+
+
+def executar(arquivo, periodos, curso, deptos, args, base_url=None):
+    """Uma consulta completa sem cache: (registros, requisições, segundos)."""
+    opcoes = {'base_url': base_url} if base_url else {}
+    if args.rps_max is not None:
+        opcoes['requisicoes_por_segundo_max'] = args.rps_max
+    consultor = ConsultorQuadroHorariosUFF(
+        periodos, curso, deptos, max_workers=args.workers, requisicoes_por_segundo=args.rps,
+        caminho_cache=None, parser_html=args.parser, **opcoes
+    )
+    if not base_url:
+        reproduzir(consultor.session, arquivo, consultor.base_url, args.latencia, args.erro, args.semente)
+    inicio = time.perf_counter()
+    dados = consultor.executar_consulta()
+    return dados, consultor.estatisticas.como_dict()['requisicoes'], time.perf_counter() - inicio
+
+
+def medir_analise(arquivo, parser):
+    """Segundos por página de turma e de busca analisadas (todas as páginas do arquivo)."""
+    turmas, listagens = [], []
+    for status, cabecalhos, conteudo in arquivo.paginas.values():
+        if status == 200:
+            html = conteudo.decode('utf-8', errors='replace')
+            (turmas if 'Vagas Alocadas' in html else listagens).append(html)
+    tempos = {}
+    for nome, paginas, funcao in (('turma', turmas, analisar_turma), ('busca', listagens, analisar_pagina_listagem)):
+        if paginas:
+            inicio = time.perf_counter()
+            for html in paginas:
+                funcao(html, parser)
+            tempos[nome] = ((time.perf_counter() - inicio) / len(paginas), len(paginas))
+    return tempos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('arquivo', nargs='?', default=CORPUS_PADRAO,
+                        help="Arquivo .zip gravado com --gravar (padrão: o corpus de benchmarks/corpus)")
+    parser.add_argument('--periodo', help="Período de referência (padrão: o da gravação)")
+    parser.add_argument('--qtd', type=int, help="Quantidade de períodos (padrão: a da gravação)")
+    parser.add_argument('--curso', help="Curso (padrão: o da gravação)")
+    parser.add_argument('--deptos', help="Departamentos separados por vírgula (padrão: os da gravação)")
+    parser.add_argument('--servidor', action='store_true', help="Servir as páginas por HTTP local em vez de no processo")
+    parser.add_argument('--latencia', type=float, default=0.0, help="Latência simulada por requisição (s)")
+    parser.add_argument('--erro', type=float, default=0.0, help="Fração de respostas 503 simuladas")
+    parser.add_argument('--semente', type=int, default=0, help="Semente do sorteio dos erros")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS_PADRAO)
+    parser.add_argument('--rps', type=float, default=0, help="Taxa inicial de requisições por segundo (padrão: sem limite)")
+    parser.add_argument('--rps-max', type=float, default=None, help="Teto da taxa adaptativa (padrão: o do consultor)")
+    parser.add_argument('--parser', default=None, help="Backend do BeautifulSoup (padrão: o mais rápido instalado)")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    arquivo = ArquivoPaginas.abrir(args.arquivo)
+    gravada = arquivo.metadados
+    periodo = normalizar_periodo(args.periodo or gravada.get('periodo', ''))
+    periodos = calcular_periodos_retroativos(periodo, args.qtd or gravada.get('qtd', 3))
+    curso = args.curso or gravada.get('curso')
+    deptos = [d.strip().upper() for d in args.deptos.split(',') if d.strip()] if args.deptos else gravada.get('deptos')
+    args.parser = escolher_parser(args.parser)
+    print(f"Arquivo: {len(arquivo)} páginas | períodos {', '.join(periodos)} | curso {curso or 'todos'} | "
+          f"departamentos {', '.join(deptos) if deptos else 'todos'}")
+    print(f"Modo: {'servidor HTTP local' if args.servidor else 'no processo'} | latência {args.latencia}s | "
+          f"erros {args.erro:.0%} | workers {args.workers} | parser {args.parser}")
+
+    servidor = ServidorReproducao(arquivo, args.latencia, args.erro, args.semente).iniciar() if args.servidor else None
+    try:
+        tempos, requisicoes, registros = [], [], set()
+        for _ in range(args.repeticoes):
+            dados, n_requisicoes, segundos = executar(arquivo, periodos, curso, deptos, args,
+                                                      servidor.url if servidor else None)
+            tempos.append(segundos)
+            requisicoes.append(n_requisicoes)
+            registros.add(len(dados))
+    finally:
+        if servidor:
+            servidor.parar()
+
+    melhor = min(tempos)
+    print(f"\nConsulta: melhor {melhor:.2f}s, média {sum(tempos) / len(tempos):.2f}s "
+          f"-> {60 / melhor:.1f} consultas/min, {requisicoes[tempos.index(melhor)] / melhor:.1f} páginas/s")
+    print(f"Registros por execução: {', '.join(str(n) for n in sorted(registros))}")
+
+    print("\nAnálise do HTML:")
+    for nome, (segundos, quantidade) in medir_analise(arquivo, args.parser).items():
+        print(f"  {nome:<6} {segundos * 1000:8.2f} ms/página ({quantidade} páginas)")
+
+    if not dados:
+        return 1
+    print(f"\nExportação ({len(dados)} registros):")
+    for formato in FORMATOS:
+        inicio = time.perf_counter()
+        try:
+            tamanho = len(exportar(dados, formato).getvalue())
+        except RuntimeError as e:
+            print(f"  {formato:<8} indisponível: {e}")
+            continue
+        print(f"  {formato:<8} {time.perf_counter() - inicio:8.3f}s ({tamanho / 1024:.0f} KiB)")
+
+    # Contagens diferentes entre execuções indicam falhas (simuladas ou não) não recuperadas
+    return 0 if len(registros) == 1 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Compara os backends de análise HTML sobre um corpus de páginas salvas do quadro de horários.
+
+Para cada backend instalado, verifica se o resultado é idêntico ao do html.parser
+(referência) e mede quantas páginas por segundo são analisadas. A leitura rápida das
+páginas de turma (expressões regulares, sem árvore) é validada contra a mesma
+referência: páginas não reconhecidas por ela contam como recurso à árvore completa.
+
+Uso:
+    python benchmarks/benchmark_parsers.py [PASTA_COM_PAGINAS] [--repeticoes 5]
+
+A pasta deve conter páginas .html salvas (buscas e páginas de turmas); também
+aceita um arquivo .zip gravado com `python -m consultor_uff ... --gravar`. Sem
+argumento usa o corpus sintético de benchmarks/corpus (páginas geradas no formato do
+quadro de horários, não capturadas do app.uff.br).
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from consultor_uff.analise import (  # noqa: E402
+    analisar_pagina_listagem, analisar_turma, analisar_turma_dom, analisar_turma_rapido, parsers_disponiveis,
+)
+from consultor_uff.reproducao import ArquivoPaginas  # noqa: E402
+
+CORPUS_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'sintetico_2026_1.zip')
+
+
+def carregar_corpus(pasta):
+    """Lê as páginas da pasta, separando páginas de turma das páginas de busca."""
+    turmas, listagens = [], []
+    if pasta.endswith('.zip'):
+        paginas = ArquivoPaginas.abrir(pasta).paginas
+        for caminho, (status, _, conteudo) in sorted(paginas.items()):
+            if status == 200:
+                html = conteudo.decode('utf-8', errors='replace')
+                (turmas if 'Vagas Alocadas' in html else listagens).append((caminho, html))
+        return turmas, listagens
+    for caminho in sorted(glob.glob(os.path.join(pasta, '**', '*.html'), recursive=True)):
+        with open(caminho, encoding='utf-8') as f:
+            html = f.read()
+        (turmas if 'Vagas Alocadas' in html else listagens).append((caminho, html))
+    return turmas, listagens
+
+
+def analisar_corpus(backend, turmas, listagens):
+    """Resultados normalizados do backend para todas as páginas do corpus."""
+    resultados = {}
+    for caminho, html in turmas:
+        resultados[caminho] = analisar_turma_dom(html, backend)
+    for caminho, html in listagens:
+        links, tem_proxima, total_paginas, codigos = analisar_pagina_listagem(html, backend)
+        resultados[caminho] = (sorted(links), tem_proxima, total_paginas, codigos)
+    return resultados
+
+
+def medir(funcao, paginas, repeticoes):
+    """Páginas por segundo de `funcao` sobre as páginas informadas."""
+    if not paginas:
+        return None
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for _, html in paginas:
+            funcao(html)
+    return len(paginas) * repeticoes / (time.perf_counter() - inicio)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pasta', nargs='?', default=CORPUS_PADRAO,
+                        help="Pasta com as páginas .html salvas ou arquivo .zip gravado (padrão: o corpus versionado)")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    turmas, listagens = carregar_corpus(args.pasta)
+    if not turmas and not listagens:
+        print(f"Nenhuma página .html encontrada em {args.pasta}")
+        return 2
+    print(f"Corpus: {len(turmas)} páginas de turma, {len(listagens)} páginas de busca")
+
+    referencia = analisar_corpus('html.parser', turmas, listagens)
+    divergencias = 0
+    formatar = lambda v: f"{v:10.1f}" if v is not None else f"{'-':>10}"
+    print(f"{'backend':<12} {'turmas/s':>10} {'buscas/s':>10}  resultado")
+    for backend in parsers_disponiveis():
+        resultados = analisar_corpus(backend, turmas, listagens)
+        diferentes = [caminho for caminho in referencia if resultados[caminho] != referencia[caminho]]
+        divergencias += len(diferentes)
+
+        velocidade_turmas = medir(lambda html: analisar_turma_dom(html, backend), turmas, args.repeticoes)
+        velocidade_buscas = medir(lambda html: analisar_pagina_listagem(html, backend), listagens, args.repeticoes)
+        status = "idêntico" if not diferentes else f"{len(diferentes)} página(s) diferente(s)"
+        print(f"{backend:<12} {formatar(velocidade_turmas)} {formatar(velocidade_buscas)}  {status}")
+        for caminho in diferentes[:10]:
+            print(f"    divergência: {caminho}")
+
+    # Leitura rápida: mesmas páginas de turma, comparadas com a árvore completa do html.parser
+    lidas = [caminho for caminho, html in turmas if analisar_turma_rapido(html) is not None]
+    diferentes = [caminho for caminho, html in turmas
+                  if (analisar_turma_rapido(html) or referencia[caminho]) != referencia[caminho]]
+    divergencias += len(diferentes)
+    velocidade_turmas = medir(analisar_turma, turmas, args.repeticoes)
+    status = "idêntico" if not diferentes else f"{len(diferentes)} página(s) diferente(s)"
+    print(f"{'rápido':<12} {formatar(velocidade_turmas)} {'-':>10}  {status} "
+          f"({len(turmas) - len(lidas)} de {len(turmas)} página(s) pela árvore completa)")
+    for caminho in diferentes[:10]:
+        print(f"    divergência: {caminho}")
+
+    return 1 if divergencias else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""
+Consultor do Quadro de Horários da UFF.
+
+Coleta vagas, inscritos e horários das turmas (requests + BeautifulSoup) e gera a
+planilha comparativa entre períodos. Pode ser usado como biblioteca, pela linha de
+comando (``python -m consultor_uff``) ou pela interface Streamlit (``streamlit_app.py``).
+"""
+
+from .cache import CacheResultados, CacheTurmas
+from .consultor import ConsultorQuadroHorariosUFF
+from .historico import HistoricoInscritos
+from .periodos import calcular_periodos_retroativos, periodo_vigente
+from .registros import RegistroTurma
+
+__all__ = [
+    'CacheResultados',
+    'CacheTurmas',
+    'ConsultorQuadroHorariosUFF',
+    'HistoricoInscritos',
+    'RegistroTurma',
+    'calcular_periodos_retroativos',
+    'gerar_excel_comparativo',
+    'periodo_vigente',
+]
+
+
+def gerar_excel_comparativo(dados):
+    """Gera a planilha Excel comparativa (importa pandas/openpyxl só quando chamada)."""
+    from .excel import gerar_excel_comparativo as gerar
+    return gerar(dados)
@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Protegido: os processos da coleta particionada podem reimportar este módulo
+if __name__ == '__main__':
+    sys.exit(main())
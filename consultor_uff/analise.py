@@ -0,0 +1,324 @@
+"""Análise do HTML das páginas de busca e de turma do quadro de horários."""
+
+import html as html_lib
+import logging
+import os
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+from .horarios import DIAS, codificar_horario
+
+logger = logging.getLogger(__name__)
+
+# Nas páginas de busca só interessam as linhas da tabela, os links e a paginação
+FILTRO_LISTAGEM = SoupStrainer(['tr', 'a', 'nav', 'ul'])
+
+# Código da disciplina (ex.: GQI00038); as três letras identificam o departamento
+RE_CODIGO_DISCIPLINA = re.compile(r'\b([A-Z]{3}\d{5})\b')
+
+# Endereço do sistema da UFF (links relativos das páginas de busca são resolvidos a partir dele)
+URL_BASE_PADRAO = 'https://app.uff.br'
+
+# Código do curso no início da linha de "Vagas Alocadas" (ex.: "028 - Química")
+RE_CODIGO_CURSO = re.compile(r'^\s*(\d{3,})\s*-')
+
+# No formulário de busca só interessa a lista de cursos
+FILTRO_FORMULARIO = SoupStrainer('select')
+
+# Leitura rápida da página de turma: só o título e as duas tabelas, sem montar a árvore
+RE_H1 = re.compile(r'<h1\b[^>]*>(.*?)</h1\s*>', re.S | re.I)
+RE_H1_INICIO = re.compile(r'<h1\b', re.I)
+RE_H5 = re.compile(r'<h5\b[^>]*>(.*?)</h5\s*>', re.S | re.I)
+RE_TABELA_INICIO = re.compile(r'<table\b[^>]*>', re.I)
+RE_TABELA_FIM = re.compile(r'</table\s*>', re.I)
+RE_LINHA = re.compile(r'<tr\b[^>]*>(.*?)</tr\s*>', re.S | re.I)
+RE_LINHA_INICIO = re.compile(r'<tr\b', re.I)
+RE_CELULA = re.compile(r'<td\b[^>]*>(.*?)</td\s*>', re.S | re.I)
+RE_CELULA_INICIO = re.compile(r'<td\b', re.I)
+RE_TAG = re.compile(r'<[^<>]*>')
+RE_ENTIDADE_INCOMPLETA = re.compile(r'&(?![A-Za-z][A-Za-z0-9]*;|#[0-9]+;|#[xX][0-9A-Fa-f]+;)')
+# Comentários, scripts e estilos não têm texto visível: removidos antes da leitura rápida
+RE_IGNORADOS = re.compile(r'<!--.*?-->|<script\b.*?</script\s*>|<style\b.*?</style\s*>', re.S | re.I)
+RE_IGNORADOS_INICIO = re.compile(r'<script\b|<style\b', re.I)
+
+# Backends do BeautifulSoup em ordem de preferência (o mais rápido primeiro)
+PARSERS_PREFERIDOS = ['lxml', 'html.parser']
+
+
+def parsers_disponiveis():
+    """Lista os backends de análise HTML instalados, em ordem de preferência."""
+    return [nome for nome in PARSERS_PREFERIDOS if builder_registry.lookup(nome)]
+
+
+def escolher_parser(preferido=None):
+    """Retorna o backend a usar: o preferido (ou CONSULTOR_UFF_PARSER) se instalado, senão o mais rápido."""
+    preferido = preferido or os.environ.get('CONSULTOR_UFF_PARSER')
+    if preferido and builder_registry.lookup(preferido):
+        return preferido
+    return parsers_disponiveis()[0]
+
+
+def analisar_pagina_listagem(html, parser=None, base_url=URL_BASE_PADRAO):
+    """Lê uma página de resultados uma única vez.
+
+    Retorna (links das turmas, se há próxima página, total de páginas da busca,
+    {link: código da disciplina}). O código vem do texto da linha da tabela e só
+    aparece quando pôde ser identificado. Só as linhas, os links e os blocos de
+    paginação são convertidos em árvore.
+    """
+    links = set()
+    codigos = {}
+    tem_proxima = False
+    total_paginas = 1
+    try:
+        soup = BeautifulSoup(html, parser or escolher_parser(), parse_only=FILTRO_LISTAGEM)
+        for link in soup.find_all('a', href=True):
+            if '/turmas/' in link['href']:
+                full_url = f"{base_url}{link['href']}" if not link['href'].startswith('http') else link['href']
+                full_url = full_url.split('?')[0]
+                links.add(full_url)
+                linha = link.find_parent('tr')
+                codigo = RE_CODIGO_DISCIPLINA.search(linha.get_text(' ')) if linha else None
+                if codigo:
+                    codigos[full_url] = codigo.group(1)
+
+        paginacao = soup.find('nav', class_='pagination') or soup.find('ul', class_='pagination')
+        if paginacao:
+            next_link = paginacao.find('a', rel='next') or paginacao.find('a', string=re.compile('›|Próximo|Next'))
+            tem_proxima = next_link is not None
+            # Maior número de página citado na paginação (links "page=N" ou texto numérico)
+            for link in paginacao.find_all('a', href=True):
+                numero = re.search(r'[?&]page=(\d+)', link['href'])
+                if numero:
+                    total_paginas = max(total_paginas, int(numero.group(1)))
+            for item in paginacao.find_all(string=re.compile(r'^\s*\d+\s*$')):
+                total_paginas = max(total_paginas, int(item))
+    except Exception as e:
+        logger.warning("Erro ao extrair links: %s", e)
+    return list(links), tem_proxima, total_paginas, codigos
+
+
+def codigo_curso(curso_nome):
+    """Código do curso citado no nome da linha de vagas ('028 - Química' -> '28'), ou None."""
+    codigo = RE_CODIGO_CURSO.match(curso_nome)
+    # Sem os zeros à esquerda, como o id do formulário de busca
+    return str(int(codigo.group(1))) if codigo else None
+
+
+def analisar_cursos(html, parser=None):
+    """Lê as opções de curso do formulário de busca: {nome do curso: id}.
+
+    Nomes repetidos (o mesmo curso em campi diferentes) recebem o id entre parênteses.
+    """
+    soup = BeautifulSoup(html, parser or escolher_parser(), parse_only=FILTRO_FORMULARIO)
+    select = soup.find('select', attrs={'name': re.compile('idcurso')})
+    cursos = {}
+    if not select:
+        return cursos
+    for opcao in select.find_all('option'):
+        id_curso = (opcao.get('value') or '').strip()
+        nome = ' '.join(opcao.get_text().split())
+        if not id_curso.isdigit() or not nome:
+            continue
+        if nome in cursos and cursos[nome] != id_curso:
+            nome = f"{nome} ({id_curso})"
+        cursos[nome] = id_curso
+    return cursos
+
+
+def _montar_turma(titulo, celulas_horario, linhas_vagas):
+    """Dados da turma a partir dos textos extraídos (comum à leitura rápida e à árvore completa).
+
+    `celulas_horario`: textos das células da primeira linha de dados da tabela de
+    horários (None se não houver); `linhas_vagas`: textos das células de cada linha de
+    dados de "Vagas Alocadas" (sem as duas linhas de cabeçalho).
+    """
+    match = re.search(r'Turma\s+(\S+)\s+de\s+(\S+)\s+-\s+(.+)', titulo)
+    if not match:
+        return None
+
+    turma, codigo, nome = match.group(1), match.group(2), match.group(3)
+    depto = codigo[:3]
+
+    horario_str = "Não informado"
+    if celulas_horario:
+        horarios = [f"{DIAS[i]}: {texto.strip()}" for i, texto in enumerate(celulas_horario)
+                    if texto.strip() and i < len(DIAS)]
+        if horarios:
+            horario_str = " | ".join(horarios)
+
+    vagas = []
+    try:
+        for cols in linhas_vagas:
+            if len(cols) >= 5:
+                vagas.append({
+                    'curso_nome': cols[0].strip(),
+                    'codigo_curso': codigo_curso(cols[0]),
+                    'vagas_reg': int(cols[1]) if cols[1].strip().isdigit() else 0,
+                    'vagas_vest': int(cols[2]) if cols[2].strip().isdigit() else 0,
+                    'inscritos_reg': int(cols[3]) if cols[3].strip().isdigit() else 0,
+                    'inscritos_vest': int(cols[4]) if cols[4].strip().isdigit() else 0,
+                })
+    except Exception:
+        pass
+
+    return {
+        'depto': depto,
+        'codigo': codigo,
+        'disciplina': nome,
+        'turma': turma,
+        'horario': horario_str,
+        'horario_bits': codificar_horario(horario_str),  # faixas ocupadas, para detectar choques
+        'vagas': vagas,
+    }
+
+
+def analisar_turma_dom(html, parser=None):
+    """Leitura da página de turma pela árvore completa do BeautifulSoup (aceita qualquer estrutura)."""
+    soup = BeautifulSoup(html, parser or escolher_parser())
+
+    # Extrair título
+    h1 = soup.find('h1')
+    if not h1:
+        return None
+
+    # Extrair horários
+    celulas_horario = None
+    try:
+        h5_horario = soup.find('h5', string=re.compile('Horários'))
+        if h5_horario:
+            tabela = h5_horario.find_next('table')
+            if tabela:
+                trs = tabela.find_all('tr')
+                if len(trs) > 1:
+                    celulas_horario = [c.text for c in trs[1].find_all('td')]
+    except Exception:
+        pass
+
+    # Extrair vagas de todos os cursos de uma só vez
+    linhas_vagas = []
+    try:
+        h5_vagas = soup.find('h5', string=re.compile('Vagas Alocadas'))
+        if h5_vagas:
+            tabela = h5_vagas.find_next('table')
+            if tabela:
+                linhas_vagas = [
+                    [c.text for c in row.find_all('td')]
+                    for row in tabela.find_all('tr')[2:]  # Pular cabeçalhos
+                ]
+    except Exception:
+        pass
+
+    return _montar_turma(h1.get_text(strip=True), celulas_horario, linhas_vagas)
+
+
+def _texto(fragmento):
+    """Texto de um trecho de HTML sem tags (como `.text`); None se o trecho tiver algo inesperado."""
+    if '<' in fragmento:
+        fragmento = RE_TAG.sub('', fragmento)
+        if '<' in fragmento or '>' in fragmento:
+            return None
+    if '&' in fragmento:
+        if RE_ENTIDADE_INCOMPLETA.search(fragmento):
+            return None
+        fragmento = html_lib.unescape(fragmento)
+    # Quebras de linha \r dentro do texto podem ser normalizadas de formas diferentes por cada backend
+    return None if '\r' in fragmento.strip() else fragmento
+
+
+def _tabela_apos(html, posicao):
+    """Linhas (textos das células <td>) da primeira tabela após `posicao`; None se não reconhecida."""
+    inicio = RE_TABELA_INICIO.search(html, posicao)
+    if not inicio:
+        return []
+    fim = RE_TABELA_FIM.search(html, inicio.end())
+    if not fim:
+        return None
+    tabela = html[inicio.end():fim.start()]
+    # Tabelas aninhadas ou tags sem fechamento: fica para a árvore completa
+    if RE_TABELA_INICIO.search(tabela):
+        return None
+    linhas = RE_LINHA.findall(tabela)
+    if len(linhas) != len(RE_LINHA_INICIO.findall(tabela)):
+        return None
+    resultado = []
+    for linha in linhas:
+        celulas = RE_CELULA.findall(linha)
+        if len(celulas) != len(RE_CELULA_INICIO.findall(linha)):
+            return None
+        textos = [_texto(celula) for celula in celulas]
+        if None in textos:
+            return None
+        resultado.append(textos)
+    return resultado
+
+
+def analisar_turma_rapido(html):
+    """Leitura direta da página de turma por expressões regulares, sem montar a árvore.
+
+    Só lê o título (h1), a primeira linha de dados da tabela de horários e as linhas de
+    "Vagas Alocadas". Retorna None quando a página não tem a estrutura esperada (o
+    resultado, quando existe, é o mesmo de analisar_turma_dom).
+    """
+    if '<!--' in html or RE_IGNORADOS_INICIO.search(html):
+        html = RE_IGNORADOS.sub('', html)
+        if '<!--' in html:
+            return None
+
+    h1 = RE_H1.search(html)
+    if not h1 or RE_H1_INICIO.search(h1.group(1)):
+        return None
+    partes = [_texto(parte) for parte in RE_TAG.split(h1.group(1))]
+    if None in partes:
+        return None
+    titulo = ''.join(parte.strip() for parte in partes)
+
+    # O primeiro h5 de cada seção, como soup.find('h5', string=...), que só aceita h5 de texto simples
+    secoes = {}
+    for h5 in RE_H5.finditer(html):
+        conteudo = h5.group(1)
+        texto = _texto(conteudo)
+        if texto is None:
+            return None
+        for nome in ('Horários', 'Vagas Alocadas'):
+            if nome in secoes or nome not in texto:
+                continue
+            if '<' in conteudo:
+                return None
+            secoes[nome] = h5.end()
+        if len(secoes) == 2:
+            break
+
+    celulas_horario = None
+    if 'Horários' in secoes:
+        linhas = _tabela_apos(html, secoes['Horários'])
+        if linhas is None:
+            return None
+        # Linhas só de <th> contam como linhas da tabela (como em find_all('tr'))
+        if len(linhas) > 1:
+            celulas_horario = linhas[1]
+
+    linhas_vagas = []
+    if 'Vagas Alocadas' in secoes:
+        linhas = _tabela_apos(html, secoes['Vagas Alocadas'])
+        if linhas is None:
+            return None
+        linhas_vagas = linhas[2:]  # Pular cabeçalhos
+
+    return _montar_turma(titulo, celulas_horario, linhas_vagas)
+
+
+def analisar_turma(html, parser=None, ao_recorrer=None):
+    """Extrai título, horários e todas as linhas de "Vagas Alocadas" de uma página de turma.
+
+    Tenta a leitura rápida e recorre à árvore completa quando a estrutura não é
+    reconhecida; `ao_recorrer()`, se informado, é chamado nesse caso.
+    """
+    dados = analisar_turma_rapido(html)
+    if dados is None:
+        if ao_recorrer:
+            ao_recorrer()
+        dados = analisar_turma_dom(html, parser)
+    return dados
@@ -0,0 +1,309 @@
+"""Caches do consultor: SQLite persistente (turmas/buscas) e resultados em memória."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+CAMINHO_CACHE_PADRAO = os.environ.get(
+    'CONSULTOR_UFF_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'consultor_uff', 'cache.sqlite3')
+)
+TTL_PERIODO_ATUAL_PADRAO = 3600  # segundos
+VALIDADE_CURSOS_PADRAO = 7 * 24 * 3600  # lista de cursos do formulário de busca
+# Incrementar quando o formato das tabelas ou dos dados analisados mudar: o cache antigo é descartado
+VERSAO_CACHE = 7
+
+
+class CacheTurmas:
+    """Guarda em SQLite as turmas já analisadas e os links das buscas, por período."""
+
+    def __init__(self, caminho=CAMINHO_CACHE_PADRAO):
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self._lock = threading.Lock()
+        # timeout/WAL: o mesmo arquivo pode ser usado por vários processos (coleta particionada)
+        self._conn = sqlite3.connect(caminho, check_same_thread=False, timeout=60)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._lock, self._conn:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != VERSAO_CACHE:
+                for (tabela,) in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                    self._conn.execute(f'DROP TABLE "{tabela}"')
+                self._conn.execute(f"PRAGMA user_version = {VERSAO_CACHE}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS turmas ("
+                " periodo TEXT NOT NULL, url TEXT NOT NULL, dados TEXT NOT NULL, atualizado_em REAL NOT NULL,"
+                " PRIMARY KEY (periodo, url))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS listagens ("
+                " periodo TEXT NOT NULL, id_curso TEXT NOT NULL, departamento TEXT NOT NULL,"
+                " links TEXT NOT NULL, atualizado_em REAL NOT NULL,"
+                " PRIMARY KEY (periodo, id_curso, departamento))"
+            )
+            # Validadores HTTP e hash do conteúdo de cada página, com a análise feita sobre ele
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS respostas ("
+                " url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, hash TEXT NOT NULL,"
+                " analise TEXT NOT NULL, atualizado_em REAL NOT NULL)"
+            )
+            # Cursos oferecidos no formulário de busca de cada servidor
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cursos ("
+                " base_url TEXT PRIMARY KEY, cursos TEXT NOT NULL, atualizado_em REAL NOT NULL)"
+            )
+            # Checkpoints de consultas: plano de turmas a processar e turmas já concluídas
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                " chave TEXT PRIMARY KEY, plano TEXT NOT NULL, criado_em REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoint_turmas ("
+                " chave TEXT NOT NULL, url TEXT NOT NULL, registros TEXT NOT NULL,"
+                " PRIMARY KEY (chave, url))"
+            )
+            # Turmas que falharam na última execução concluída de cada consulta (tentadas primeiro na próxima)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS turmas_pendentes ("
+                " chave TEXT NOT NULL, url TEXT NOT NULL, alvos TEXT NOT NULL, criado_em REAL NOT NULL,"
+                " PRIMARY KEY (chave, url))"
+            )
+
+    def _ler(self, sql, params, validade):
+        with self._lock:
+            linha = self._conn.execute(sql, params).fetchone()
+        if not linha:
+            return None
+        valor, atualizado_em = linha
+        if validade is not None and time.time() - atualizado_em > validade:
+            return None
+        return json.loads(valor)
+
+    def _gravar(self, sql, params):
+        with self._lock, self._conn:
+            self._conn.execute(sql, params)
+
+    def obter_turma(self, periodo, url, validade=None):
+        """Retorna os dados analisados da turma, ou None se ausentes/expirados."""
+        return self._ler(
+            "SELECT dados, atualizado_em FROM turmas WHERE periodo = ? AND url = ?",
+            (periodo, url), validade
+        )
+
+    def salvar_turma(self, periodo, url, dados):
+        self._gravar(
+            "INSERT OR REPLACE INTO turmas (periodo, url, dados, atualizado_em) VALUES (?, ?, ?, ?)",
+            (periodo, url, json.dumps(dados, ensure_ascii=False), time.time())
+        )
+
+    def obter_links(self, periodo, id_curso, departamento, validade=None):
+        """Retorna os links de uma busca (período, curso, departamento) como {link: código}, ou None."""
+        return self._ler(
+            "SELECT links, atualizado_em FROM listagens WHERE periodo = ? AND id_curso = ? AND departamento = ?",
+            (periodo, id_curso, departamento or ''), validade
+        )
+
+    def salvar_links(self, periodo, id_curso, departamento, links):
+        self._gravar(
+            "INSERT OR REPLACE INTO listagens (periodo, id_curso, departamento, links, atualizado_em)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (periodo, id_curso, departamento or '', json.dumps(dict(sorted(links.items()))), time.time())
+        )
+
+    def obter_cursos(self, base_url, validade=VALIDADE_CURSOS_PADRAO):
+        """Retorna os cursos do formulário de busca ({nome: id}), ou None se ausentes/expirados."""
+        return self._ler("SELECT cursos, atualizado_em FROM cursos WHERE base_url = ?", (base_url,), validade)
+
+    def salvar_cursos(self, base_url, cursos):
+        self._gravar(
+            "INSERT OR REPLACE INTO cursos (base_url, cursos, atualizado_em) VALUES (?, ?, ?)",
+            (base_url, json.dumps(cursos, ensure_ascii=False), time.time())
+        )
+
+    def obter_resposta(self, url):
+        """Retorna etag, last_modified, hash e a análise da última versão baixada da página, ou None."""
+        with self._lock:
+            linha = self._conn.execute(
+                "SELECT etag, last_modified, hash, analise FROM respostas WHERE url = ?", (url,)
+            ).fetchone()
+        if not linha:
+            return None
+        etag, last_modified, hash_conteudo, analise = linha
+        return {'etag': etag, 'last_modified': last_modified, 'hash': hash_conteudo, 'analise': json.loads(analise)}
+
+    def salvar_resposta(self, url, etag, last_modified, hash_conteudo, analise):
+        self._gravar(
+            "INSERT OR REPLACE INTO respostas (url, etag, last_modified, hash, analise, atualizado_em)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, hash_conteudo, json.dumps(analise, ensure_ascii=False), time.time())
+        )
+
+    def obter_checkpoint(self, chave, validade=None):
+        """Retorna (plano, {url: registros já coletados}) da consulta interrompida, ou None."""
+        with self._lock:
+            linha = self._conn.execute(
+                "SELECT plano, criado_em FROM checkpoints WHERE chave = ?", (chave,)
+            ).fetchone()
+            if not linha:
+                return None
+            concluidas = self._conn.execute(
+                "SELECT url, registros FROM checkpoint_turmas WHERE chave = ?", (chave,)
+            ).fetchall()
+        plano, criado_em = linha
+        if validade is not None and time.time() - criado_em > validade:
+            self.remover_checkpoint(chave)
+            return None
+        return json.loads(plano), {url: json.loads(registros) for url, registros in concluidas}
+
+    def iniciar_checkpoint(self, chave, plano):
+        """Grava o plano (turmas a processar) de uma consulta, descartando checkpoint anterior."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM checkpoint_turmas WHERE chave = ?", (chave,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (chave, plano, criado_em) VALUES (?, ?, ?)",
+                (chave, json.dumps(plano, ensure_ascii=False), time.time())
+            )
+
+    def registrar_checkpoint(self, chave, turmas):
+        """Registra turmas concluídas: lista de (url, registros)."""
+        if not turmas:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO checkpoint_turmas (chave, url, registros) VALUES (?, ?, ?)",
+                [(chave, url, json.dumps([dict(r) for r in registros], ensure_ascii=False)) for url, registros in turmas]
+            )
+
+    def obter_pendentes(self, chave, validade=None):
+        """Turmas que falharam na última execução da consulta: {url: alvos}."""
+        with self._lock:
+            linhas = self._conn.execute(
+                "SELECT url, alvos, criado_em FROM turmas_pendentes WHERE chave = ?", (chave,)
+            ).fetchall()
+        agora = time.time()
+        return {
+            url: json.loads(alvos) for url, alvos, criado_em in linhas
+            if validade is None or agora - criado_em <= validade
+        }
+
+    def salvar_pendentes(self, chave, turmas):
+        """Substitui as turmas pendentes da consulta por `turmas` ({url: alvos})."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM turmas_pendentes WHERE chave = ?", (chave,))
+            self._conn.executemany(
+                "INSERT INTO turmas_pendentes (chave, url, alvos, criado_em) VALUES (?, ?, ?, ?)",
+                [(chave, url, json.dumps(alvos, ensure_ascii=False), time.time()) for url, alvos in turmas.items()]
+            )
+
+    def remover_checkpoint(self, chave):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM checkpoint_turmas WHERE chave = ?", (chave,))
+            self._conn.execute("DELETE FROM checkpoints WHERE chave = ?", (chave,))
+
+
+class CacheResultados:
+    """Cache em memória dos resultados prontos, com coalescência de consultas idênticas.
+
+    Enquanto uma consulta está em andamento, outras chamadas com a mesma chave aguardam
+    o seu resultado em vez de repetir a coleta. Os itens são descartados por idade e,
+    em ordem de uso (LRU), quando excedem a quantidade ou o tamanho total configurados.
+    """
+
+    def __init__(self, max_itens=32, max_bytes=256 * 1024 * 1024, max_idade=900, medir_tamanho=None):
+        self.max_itens = max_itens
+        self.max_bytes = max_bytes
+        self.max_idade = max_idade
+        self.medir_tamanho = medir_tamanho or (lambda valor: 0)
+        self._itens = OrderedDict()  # chave -> (criado_em, tamanho, valor)
+        self._em_andamento = {}  # chave -> _ConsultaEmAndamento
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def _remover(self, chave):
+        _, tamanho, _ = self._itens.pop(chave)
+        self._total_bytes -= tamanho
+
+    def _descartar_excedentes(self):
+        agora = time.monotonic()
+        for chave in [c for c, (criado_em, _, _) in self._itens.items() if agora - criado_em > self.max_idade]:
+            self._remover(chave)
+        while self._itens and (len(self._itens) > self.max_itens or self._total_bytes > self.max_bytes):
+            self._remover(next(iter(self._itens)))
+
+    def obter(self, chave):
+        """Retorna o valor guardado (ou None), marcando-o como usado recentemente."""
+        with self._lock:
+            self._descartar_excedentes()
+            item = self._itens.get(chave)
+            if item is None:
+                return None
+            self._itens.move_to_end(chave)
+            return item[2]
+
+    def guardar(self, chave, valor):
+        tamanho = self.medir_tamanho(valor)
+        with self._lock:
+            if chave in self._itens:
+                self._remover(chave)
+            self._itens[chave] = (time.monotonic(), tamanho, valor)
+            self._total_bytes += tamanho
+            self._descartar_excedentes()
+
+    def obter_ou_calcular(self, chave, calcular, ao_aguardar=None, guardar_se=None):
+        """Retorna o valor da chave, calculando-o uma única vez mesmo com chamadas concorrentes.
+
+        Resultados None não são guardados, nem os rejeitados por ``guardar_se(valor)``
+        (as chamadas que aguardavam recebem o valor mesmo assim). ``ao_aguardar`` é
+        chamado quando esta chamada precisa esperar uma consulta idêntica já em andamento.
+        """
+        while True:
+            with self._lock:
+                item = self._itens.get(chave)
+                if item is not None and time.monotonic() - item[0] <= self.max_idade:
+                    self._itens.move_to_end(chave)
+                    return item[2]
+                voo = self._em_andamento.get(chave)
+                lider = voo is None
+                if lider:
+                    voo = _ConsultaEmAndamento()
+                    self._em_andamento[chave] = voo
+            
+            if lider:
+                break
+            
+            if ao_aguardar:
+                ao_aguardar()
+            voo.evento.wait()
+            if voo.concluida:
+                return voo.valor
+            if voo.erro is not None:
+                raise voo.erro
+            # A consulta líder foi interrompida (ex.: rerun do Streamlit): tentar novamente
+        
+        try:
+            voo.valor = calcular()
+            if voo.valor is not None and (guardar_se is None or guardar_se(voo.valor)):
+                self.guardar(chave, voo.valor)
+            voo.concluida = True
+            return voo.valor
+        except Exception as e:
+            voo.erro = e
+            raise
+        finally:
+            with self._lock:
+                del self._em_andamento[chave]
+            voo.evento.set()
+
+
+class _ConsultaEmAndamento:
+    """Consulta em execução aguardada pelas chamadas com a mesma chave."""
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.concluida = False
+        self.valor = None
+        self.erro = None
@@ -0,0 +1,253 @@
+"""
+Linha de comando do consultor (uso em lote/cron, sem Streamlit).
+
+Exemplo:
+    python -m consultor_uff 2026.1 --qtd 3 --curso Química --deptos GQI,GQO -o comparativo.xlsx
+    python -m consultor_uff 2026.1 --todos-cursos --processos 4 --formatos parquet
+    python -m consultor_uff 2026.1 --qtd 1 --conflitos GQI00038,GQO00012
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+
+import requests
+
+from .analise import URL_BASE_PADRAO
+from .cache import CAMINHO_CACHE_PADRAO
+from .consultor import ConsultorQuadroHorariosUFF
+from .exportacao import FORMATOS, exportar
+from .historico import CAMINHO_HISTORICO_PADRAO, HistoricoInscritos
+from .horarios import CAMPOS_CONFLITOS, conflitos_entre_disciplinas
+from .monitoramento import INTERVALO_MAXIMO_PADRAO, INTERVALO_MINIMO_PADRAO, MonitorTurmas
+from .particionamento import CURSOS_POR_PARTICAO_PADRAO, executar_particionado
+from .periodos import calcular_periodos_retroativos, normalizar_periodo
+from .reproducao import ArquivoPaginas, gravar, reproduzir
+from .transporte import MAX_WORKERS_PADRAO, REQUISICOES_POR_SEGUNDO_MAX_PADRAO, REQUISICOES_POR_SEGUNDO_PADRAO
+
+
+def inteiro_positivo(valor):
+    """Tipo do argparse para quantidades: inteiro maior ou igual a 1."""
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inteiro inválido: {valor!r}")
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"deve ser pelo menos 1: {valor!r}")
+    return numero
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m consultor_uff',
+        description="Gera a planilha comparativa de vagas e horários do Quadro de Horários da UFF."
+    )
+    parser.add_argument('periodo', help="Período de referência, formato AAAA.S (ex: 2026.1)")
+    parser.add_argument('--qtd', type=inteiro_positivo, default=3, help="Quantidade de períodos na comparação (padrão: 3)")
+    parser.add_argument('--curso', help="Curso a consultar (padrão: Química e Química Industrial); "
+                                        "outros nomes são procurados na lista de cursos da UFF")
+    parser.add_argument('--todos-cursos', action='store_true', help="Consultar todos os cursos da lista da UFF")
+    parser.add_argument('--listar-cursos', action='store_true', help="Só mostrar a lista de cursos da UFF (id e nome)")
+    parser.add_argument('--processos', type=inteiro_positivo, default=1,
+                        help="Processos da coleta particionada por período e grupo de cursos (padrão: 1)")
+    parser.add_argument('--cursos-por-particao', type=inteiro_positivo, default=CURSOS_POR_PARTICAO_PADRAO,
+                        help=f"Cursos por partição com --processos (padrão: {CURSOS_POR_PARTICAO_PADRAO})")
+    parser.add_argument('--deptos', default='', help="Departamentos separados por vírgula (ex: GQI,GQO)")
+    parser.add_argument('-o', '--saida', help="Arquivo .xlsx de saída (padrão: Comparativo_<periodo>_e_anteriores.xlsx); "
+                                              "os demais formatos usam o mesmo nome com outra extensão")
+    parser.add_argument('--formatos', default='xlsx',
+                        help=f"Formatos a gerar, separados por vírgula: {', '.join(FORMATOS)} (padrão: xlsx)")
+    parser.add_argument('--workers', type=inteiro_positivo, default=MAX_WORKERS_PADRAO, help="Downloads simultâneos")
+    parser.add_argument('--rps', type=float, default=REQUISICOES_POR_SEGUNDO_PADRAO,
+                        help="Taxa inicial de requisições por segundo (0 desliga o limite)")
+    parser.add_argument('--rps-max', type=float, default=REQUISICOES_POR_SEGUNDO_MAX_PADRAO,
+                        help="Teto da taxa adaptativa de requisições por segundo (padrão: %(default)s)")
+    parser.add_argument('--cache', default=CAMINHO_CACHE_PADRAO, help="Arquivo SQLite do cache persistente")
+    parser.add_argument('--sem-cache', action='store_true', help="Não usar o cache persistente")
+    parser.add_argument('--base-url', default=URL_BASE_PADRAO, help="Endereço do sistema (ex.: servidor de reprodução local)")
+    parser.add_argument('--gravar', metavar='ARQUIVO_ZIP',
+                        help="Gravar as páginas baixadas para reprodução posterior "
+                             "(desativa o cache, para que todas sejam baixadas)")
+    parser.add_argument('--reproduzir', metavar='ARQUIVO_ZIP', help="Usar páginas gravadas em vez de acessar a rede")
+    parser.add_argument('--plano', action='store_true', help="Só mostrar o plano de buscas (sem baixar nada)")
+    parser.add_argument('--historico', nargs='?', const=CAMINHO_HISTORICO_PADRAO, metavar='ARQUIVO',
+                        help="Registrar os inscritos desta execução no histórico de capturas "
+                             f"(padrão: {CAMINHO_HISTORICO_PADRAO})")
+    parser.add_argument('--conflitos', nargs='?', const='', metavar='CODIGOS',
+                        help="Gravar <saida>_conflitos.csv com os pares de disciplinas com choque de horário "
+                             "(opcional: só entre os códigos informados, separados por vírgula)")
+    parser.add_argument('--monitorar', action='store_true',
+                        help="Acompanhar continuamente o período de referência, emitindo as mudanças em JSON Lines")
+    parser.add_argument('--duracao', type=float, help="Tempo máximo de monitoramento em segundos (padrão: até Ctrl+C)")
+    parser.add_argument('--intervalo-minimo', type=float, default=INTERVALO_MINIMO_PADRAO,
+                        help="Intervalo entre consultas de turmas quase lotadas ou recém-alteradas (s)")
+    parser.add_argument('--intervalo-maximo', type=float, default=INTERVALO_MAXIMO_PADRAO,
+                        help="Intervalo entre consultas de turmas vazias e estáveis (s)")
+    parser.add_argument('--metricas', metavar='ARQUIVO_JSON',
+                        help="Gravar tempos por fase, status HTTP, bytes e acertos de cache em JSON ('-' para a saída padrão)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Não mostrar o andamento")
+    return parser
+
+
+def salvar_metricas(diagnostico, destino):
+    """Grava o diagnóstico da execução em JSON (uma linha na saída padrão com '-')."""
+    if not destino:
+        return
+    if destino == '-':
+        print(json.dumps(diagnostico, ensure_ascii=False))
+        return
+    with open(destino, 'w', encoding='utf-8') as f:
+        json.dump(diagnostico, f, ensure_ascii=False, indent=2)
+
+
+def diagnostico(consultor, estatisticas, diagnosticos_particoes=None):
+    """Diagnóstico da execução; na coleta particionada, o de cada partição e os totais HTTP."""
+    if diagnosticos_particoes is None:
+        return consultor.diagnostico()
+    return {'http': estatisticas, 'particoes': diagnosticos_particoes, **consultor.metricas.como_dict()}
+
+
+def monitorar(consultor, args):
+    """Modo de monitoramento: um evento JSON por linha na saída padrão a cada mudança."""
+    def emitir(evento):
+        print(json.dumps(evento, ensure_ascii=False), flush=True)
+
+    monitor = MonitorTurmas(consultor, emitir, args.intervalo_minimo, args.intervalo_maximo)
+    try:
+        monitor.executar(args.duracao)
+    except KeyboardInterrupt:
+        pass
+    salvar_metricas(consultor.diagnostico(), args.metricas)
+    return 0
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    logging.basicConfig(level=logging.ERROR if args.quiet else logging.INFO, format='%(levelname)s: %(message)s')
+
+    try:
+        periodo_ref = normalizar_periodo(args.periodo)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    formatos = [f.strip().lower() for f in args.formatos.split(',') if f.strip()]
+    desconhecidos = [f for f in formatos if f not in FORMATOS]
+    if not formatos or desconhecidos:
+        print(f"Formato(s) inválido(s): {', '.join(desconhecidos) or '(nenhum)'}. Use: {', '.join(FORMATOS)}",
+              file=sys.stderr)
+        return 2
+
+    periodos = [periodo_ref] if args.monitorar else calcular_periodos_retroativos(periodo_ref, args.qtd)
+    deptos = [d.strip().upper() for d in args.deptos.split(',') if d.strip()] or None
+    saida = args.saida or f"Comparativo_{periodo_ref}_e_anteriores.xlsx"
+
+    # Andamento só em terminal interativo (execuções via cron ficam limpas)
+    mostrar_andamento = not args.quiet and sys.stderr.isatty()
+
+    def progresso(fracao, mensagem):
+        if mostrar_andamento:
+            print(f"\r[{fracao:4.0%}] {mensagem:<70}", end='', file=sys.stderr, flush=True)
+
+    consultor = ConsultorQuadroHorariosUFF(
+        periodos, args.curso, deptos,
+        max_workers=args.workers,
+        requisicoes_por_segundo=args.rps,
+        requisicoes_por_segundo_max=args.rps_max,
+        caminho_cache=None if args.sem_cache or args.gravar else args.cache,
+        base_url=args.base_url,
+    )
+    if args.reproduzir:
+        reproduzir(consultor.session, ArquivoPaginas.abrir(args.reproduzir), consultor.base_url)
+    if args.processos > 1 and (args.gravar or args.reproduzir):
+        print("--gravar/--reproduzir não podem ser usados com --processos (use --base-url com um servidor de reprodução)",
+              file=sys.stderr)
+        return 2
+    if args.gravar:
+        # Os metadados permitem repetir a mesma consulta sobre o arquivo (benchmarks/benchmark_consulta.py)
+        gravadas = gravar(consultor.session, ArquivoPaginas(metadados={
+            'periodo': periodo_ref, 'qtd': args.qtd, 'curso': args.curso, 'deptos': deptos,
+        }), consultor.base_url)
+    if args.listar_cursos or args.todos_cursos or (args.curso and args.curso not in consultor.ids_cursos):
+        try:
+            cursos = consultor.descobrir_cursos()
+        except requests.exceptions.RequestException as e:
+            print(f"Não foi possível obter a lista de cursos: {e}", file=sys.stderr)
+            return 1
+        if args.listar_cursos:
+            for nome, id_curso in sorted(cursos.items()):
+                print(f"{id_curso:>6}  {nome}")
+            return 0
+        if args.curso and args.curso not in cursos:
+            print(f"Curso desconhecido: {args.curso!r} (veja --listar-cursos)", file=sys.stderr)
+            return 2
+        consultor.ids_cursos = {args.curso: cursos[args.curso]} if args.curso else cursos
+
+    if args.plano:
+        plano = consultor.planejar()
+        print(f"Plano: {plano.descrever(consultor.buscas_em_cache(plano))}")
+        for periodo, _, depto, cursos in plano.buscas:
+            print(f"  {periodo[:4]}.{periodo[4]}  {' e '.join(cursos)}  {depto or '(todos os departamentos)'}")
+        return 0
+
+    if args.monitorar:
+        return monitorar(consultor, args)
+
+    if args.processos > 1:
+        dados, diagnosticos, _ = executar_particionado(
+            periodos, {curso: consultor.ids_cursos[curso] for curso in consultor.cursos_consultados()}, deptos,
+            processos=args.processos, cursos_por_particao=args.cursos_por_particao, progresso=progresso,
+            requisicoes_por_segundo=args.rps, requisicoes_por_segundo_max=args.rps_max,
+            max_workers=args.workers, caminho_cache=None if args.sem_cache else args.cache, base_url=consultor.base_url,
+        )
+        estatisticas = {chave: sum(d['http'][chave] for d in diagnosticos) for chave in diagnosticos[0]['http']}
+    else:
+        dados = consultor.executar_consulta(progresso)
+        estatisticas, diagnosticos = consultor.estatisticas.como_dict(), None
+    if mostrar_andamento:
+        print(file=sys.stderr)
+    if args.gravar:
+        gravadas.salvar(args.gravar)
+        print(f"{len(gravadas)} páginas gravadas em {args.gravar}", file=sys.stderr)
+
+    if not dados:
+        print("Nenhum dado encontrado para os filtros selecionados.", file=sys.stderr)
+        salvar_metricas(diagnostico(consultor, estatisticas, diagnosticos), args.metricas)
+        return 1
+
+    base_saida = os.path.splitext(saida)[0]
+    arquivos = []
+    for formato in formatos:
+        extensao = FORMATOS[formato][1]
+        caminho = saida if saida.endswith(extensao) else base_saida + extensao
+        with consultor.metricas.medir(f'exportacao.{formato}'), open(caminho, 'wb') as f:
+            f.write(exportar(dados, formato).getvalue())
+        arquivos.append(caminho)
+
+    if args.conflitos is not None:
+        codigos = [c.strip().upper() for c in args.conflitos.split(',') if c.strip()] or None
+        with consultor.metricas.medir('conflitos'):
+            conflitos = conflitos_entre_disciplinas(dados, codigos)
+        caminho = base_saida + '_conflitos.csv'
+        with open(caminho, 'w', newline='', encoding='utf-8') as f:
+            escritor = csv.DictWriter(f, fieldnames=CAMPOS_CONFLITOS)
+            escritor.writeheader()
+            escritor.writerows(conflitos)
+        arquivos.append(caminho)
+        inevitaveis = sum(c['inevitavel'] for c in conflitos)
+        print(f"{len(conflitos)} par(es) de disciplinas com choque de horário ({inevitaveis} inevitável(is))",
+              file=sys.stderr)
+
+    if args.historico:
+        captura, alteradas = HistoricoInscritos(args.historico).registrar_captura(dados)
+        print(f"Captura {captura} registrada em {args.historico}: {alteradas} turma(s) nova(s) ou alterada(s)",
+              file=sys.stderr)
+
+    print(f"{len(dados)} registros salvos em {', '.join(arquivos)} "
+          f"(requisições: {estatisticas['requisicoes']}, novas tentativas: {estatisticas['retentativas']}, "
+          f"falhas: {estatisticas['falhas']})")
+    salvar_metricas(diagnostico(consultor, estatisticas, diagnosticos), args.metricas)
+    return 0
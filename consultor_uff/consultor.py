@@ -0,0 +1,598 @@
+"""Coleta das turmas do quadro de horários da UFF (requests + BeautifulSoup)."""
+
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from .analise import URL_BASE_PADRAO, analisar_cursos, analisar_pagina_listagem, analisar_turma, escolher_parser
+from .cache import CAMINHO_CACHE_PADRAO, TTL_PERIODO_ATUAL_PADRAO, VALIDADE_CURSOS_PADRAO, CacheTurmas
+from .metricas import Metricas
+from .periodos import periodo_vigente
+from .planejamento import LIMIAR_AGRUPAMENTO_PADRAO, planejar_buscas
+from .progresso import ProgressoLimitado
+from .registros import RegistroTurma
+from .transporte import (
+    MAX_TENTATIVAS_PADRAO,
+    MAX_WORKERS_PADRAO,
+    REQUISICOES_POR_SEGUNDO_MAX_PADRAO,
+    REQUISICOES_POR_SEGUNDO_PADRAO,
+    TIMEOUT_PADRAO,
+    EstatisticasHTTP,
+    LimitadorAdaptativo,
+    criar_sessao,
+)
+
+logger = logging.getLogger(__name__)
+
+VALIDADE_CHECKPOINT_PADRAO = 12 * 3600  # segundos
+
+
+class ConsultorQuadroHorariosUFF:
+    def __init__(self, periodos, curso_filtro=None, departamentos_filtro=None,
+                 max_workers=MAX_WORKERS_PADRAO, requisicoes_por_segundo=REQUISICOES_POR_SEGUNDO_PADRAO,
+                 caminho_cache=CAMINHO_CACHE_PADRAO, ttl_periodo_atual=TTL_PERIODO_ATUAL_PADRAO,
+                 parser_html=None, timeout=TIMEOUT_PADRAO, max_tentativas=MAX_TENTATIVAS_PADRAO,
+                 limiar_agrupamento=LIMIAR_AGRUPAMENTO_PADRAO, base_url=URL_BASE_PADRAO,
+                 requisicoes_por_segundo_max=REQUISICOES_POR_SEGUNDO_MAX_PADRAO, ids_cursos=None):
+        self.periodos = periodos
+        self.curso_filtro = curso_filtro
+        self.departamentos_filtro = departamentos_filtro if departamentos_filtro else []
+        self.links_processados = set()
+        self.limiar_agrupamento = limiar_agrupamento
+        self.base_url = base_url.rstrip('/')  # outro endereço permite usar um servidor de reprodução local
+        self.plano = None  # PlanoConsulta da última execução
+        
+        # Busca concorrente das turmas, limitada por uma taxa global de requisições que se
+        # adapta à latência e aos erros do servidor (entre a taxa inicial e o teto)
+        self.max_workers = max(1, int(max_workers))
+        self.limitador = LimitadorAdaptativo(requisicoes_por_segundo, requisicoes_por_segundo_max)
+        
+        # Cache persistente: períodos encerrados nunca expiram, o atual expira após o TTL
+        self.cache = CacheTurmas(caminho_cache) if caminho_cache else None
+        self.ttl_periodo_atual = ttl_periodo_atual
+        self.validade_checkpoint = VALIDADE_CHECKPOINT_PADRAO
+        
+        # Backend do BeautifulSoup (lxml quando instalado, senão html.parser)
+        self.parser_html = escolher_parser(parser_html)
+        
+        # Sessão HTTP com headers de navegador, pool do tamanho dos workers e retentativas
+        self.timeout = timeout
+        self.estatisticas = EstatisticasHTTP()
+        self.metricas = Metricas()  # tempos por fase, status HTTP, bytes e acertos de cache
+        self.urls_com_falha = []
+        self.buscas_incompletas = []  # (período, curso, departamento) com listagem interrompida
+        self.avisos = []  # (nível de logging, mensagem) da última execução
+        self.session = criar_sessao(self.max_workers, max_tentativas, self.estatisticas, self.limitador)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        })
+        
+        # Cursos consultados (nome -> id da busca); `descobrir_cursos` lista todos os da UFF
+        self.ids_cursos = dict(ids_cursos) if ids_cursos else {
+            'Química': '28',
+            'Química Industrial': '29'
+        }
+
+    def construir_url_busca(self, id_curso, departamento=None, periodo='20252', pagina=1):
+        base_url = f"{self.base_url}/graduacao/quadrodehorarios/"
+        params = [
+            "utf8=%E2%9C%93",
+            f"q%5Banosemestre_eq%5D={periodo}",
+            "q%5Bdisciplina_cod_departamento_eq%5D=",
+            f"q%5Bvagas_turma_curso_idcurso_eq%5D={id_curso}",
+        ]
+        if departamento and departamento.strip():
+            codigo_busca = f"{departamento.strip().upper()}00"
+            params.insert(0, f"q%5Bdisciplina_nome_or_disciplina_codigo_cont%5D={codigo_busca}")
+        else:
+            params.insert(0, "q%5Bdisciplina_nome_or_disciplina_codigo_cont%5D=")
+        
+        if pagina > 1:
+            params.append(f"page={pagina}")
+            
+        return base_url + "?" + "&".join(params)
+
+    def _avisar(self, nivel, mensagem):
+        """Registra um aviso da execução (exibido pela interface) e o envia ao logging."""
+        logger.log(nivel, mensagem)
+        self.avisos.append((nivel, mensagem))
+
+    def validade_cache(self, periodo):
+        """Tempo de validade (s) do cache de um período; None para períodos encerrados.
+
+        Só o calendário decide (não os outros períodos da consulta), para que o mesmo
+        período tenha a mesma validade em qualquer consulta ou partição.
+        """
+        if periodo < periodo_vigente():
+            return None
+        return self.ttl_periodo_atual
+
+    def _get(self, url, headers=None, fase='outra'):
+        """Faz um GET respeitando o limite global de requisições e contabilizando falhas.
+
+        `fase` ('listagem' ou 'turma') separa os tempos e bytes nas métricas.
+        """
+        with self.metricas.medir('espera.limitador'):
+            self.limitador.aguardar()
+        self.estatisticas.registrar('requisicoes')
+        inicio = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            self.estatisticas.registrar('falhas')
+            self.metricas.contar(f'http.erro.{type(e).__name__}')
+            self.limitador.registrar(time.perf_counter() - inicio, None)
+            raise
+        finally:
+            self.metricas.observar(f'http.{fase}', time.perf_counter() - inicio)
+        segundos = time.perf_counter() - inicio
+        self.metricas.observar(f'http.status.{response.status_code}', segundos)
+        # Respostas que passaram por novas tentativas já reduziram a taxa; o tempo delas
+        # inclui as esperas do backoff e não reflete a latência do servidor
+        retries = getattr(response.raw, 'retries', None)
+        if not (retries and retries.history):
+            self.limitador.registrar(segundos, response.status_code)
+        self.metricas.contar(f'bytes.{fase}', len(response.content))
+        if response.status_code >= 400:
+            self.estatisticas.registrar('falhas')
+        return response
+
+    def _baixar_e_analisar(self, url, analisar, fase='outra'):
+        """Baixa a página com GET condicional e devolve `analisar(html)`.
+
+        Com cache, envia If-None-Match/If-Modified-Since; se o servidor responder 304,
+        ou se o conteúdo tiver o mesmo hash da versão anterior, a análise anterior é
+        reaproveitada sem reprocessar o HTML.
+        """
+        anterior = self.cache.obter_resposta(url) if self.cache else None
+        headers = {}
+        if anterior and anterior['etag']:
+            headers['If-None-Match'] = anterior['etag']
+        if anterior and anterior['last_modified']:
+            headers['If-Modified-Since'] = anterior['last_modified']
+        
+        response = self._get(url, headers=headers or None, fase=fase)
+        if response.status_code == 304 and anterior:
+            hash_conteudo = anterior['hash']
+        else:
+            response.raise_for_status()
+            hash_conteudo = hashlib.sha1(response.content).hexdigest()
+        
+        if anterior and anterior['hash'] == hash_conteudo:
+            analise = anterior['analise']
+            self.metricas.contar(f'reaproveitamento.{fase}.acertos')
+        else:
+            with self.metricas.medir(f'analise.{fase}'):
+                analise = analisar(response.text)
+            if self.cache:
+                self.metricas.contar(f'reaproveitamento.{fase}.faltas')
+        
+        if self.cache:
+            self.cache.salvar_resposta(
+                url, response.headers.get('ETag') or (anterior or {}).get('etag'),
+                response.headers.get('Last-Modified') or (anterior or {}).get('last_modified'),
+                hash_conteudo, analise
+            )
+        return analise
+
+    def analisar_pagina_listagem(self, html):
+        """Lê uma página de resultados: (links das turmas, tem próxima página, total de páginas, códigos)."""
+        return analisar_pagina_listagem(html, self.parser_html, self.base_url)
+
+    def extrair_links_turmas_da_pagina(self, html):
+        """Extrai links de turmas do HTML da página."""
+        return self.analisar_pagina_listagem(html)[0]
+
+    def tem_proxima_pagina(self, html):
+        """Verifica se existe próxima página na paginação."""
+        return self.analisar_pagina_listagem(html)[1]
+
+    def _baixar_listagem(self, id_curso, departamento, periodo, pagina):
+        """Baixa e analisa uma página de resultados (None se a página parecer incompleta)."""
+        url = self.construir_url_busca(id_curso, departamento, periodo, pagina)
+        
+        def analisar(html):
+            # Verificar se a página carregou corretamente
+            if 'quadrodehorarios' not in html.lower() and len(html) < 1000:
+                return None
+            return self.analisar_pagina_listagem(html)
+        
+        resultado = self._baixar_e_analisar(url, analisar, 'listagem')
+        return tuple(resultado) if resultado is not None else None
+
+    def navegar_todas_paginas(self, id_curso, departamento, periodo):
+        """Navega por todas as páginas e coleta os links: {link: código da disciplina ou None}.
+
+        A primeira página informa o total de páginas; as demais são baixadas em paralelo
+        (sob o mesmo limite de requisições) e processadas em ordem, parando na primeira
+        página vazia ou com erro.
+        """
+        if self.cache:
+            links_cache = self.cache.obter_links(periodo, id_curso, departamento, self.validade_cache(periodo))
+            if links_cache is not None:
+                self.metricas.contar('cache.listagens.acertos')
+                return links_cache
+            self.metricas.contar('cache.listagens.faltas')
+        
+        todos_links = {}
+        pagina = 1
+        max_paginas = 50  # Limite de segurança
+        completo = True
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            lote = [executor.submit(self._baixar_listagem, id_curso, departamento, periodo, pagina)]
+            while lote:
+                proximo_lote = []
+                for futuro in lote:
+                    try:
+                        resultado = futuro.result()
+                    except requests.exceptions.RequestException as e:
+                        self._avisar(logging.ERROR, f"Erro de conexão na página {pagina}: {e}")
+                        completo = False
+                        break
+                    
+                    if resultado is None:
+                        self._avisar(logging.WARNING, f"Página pode estar incompleta (página {pagina})")
+                        completo = False
+                        break
+                    
+                    links, tem_proxima, total_paginas, codigos = resultado
+                    if not links:
+                        break
+                    
+                    for link in links:
+                        todos_links[link] = codigos.get(link)
+                    
+                    if not tem_proxima:
+                        break
+                    
+                    pagina += 1
+                else:
+                    # Lote processado e ainda há páginas: pedir todas as conhecidas de uma vez
+                    if pagina <= max_paginas:
+                        ultima = min(max(total_paginas, pagina), max_paginas)
+                        proximo_lote = [
+                            executor.submit(self._baixar_listagem, id_curso, departamento, periodo, p)
+                            for p in range(pagina, ultima + 1)
+                        ]
+                    else:
+                        # Limite atingido com páginas restantes: a busca não pode ser guardada como completa
+                        self._avisar(logging.WARNING, f"Busca interrompida no limite de {max_paginas} páginas "
+                                                      f"(período {periodo}, curso {id_curso}, "
+                                                      f"departamento {departamento or 'todos'}); "
+                                                      "a planilha pode estar incompleta.")
+                        completo = False
+                
+                # Páginas posteriores a uma parada antecipada não são mais necessárias
+                for futuro in lote:
+                    futuro.cancel()
+                lote = proximo_lote
+        
+        if not completo:
+            self.buscas_incompletas.append((periodo, id_curso, departamento))
+        # Só guardar buscas que terminaram sem erro
+        if self.cache and completo:
+            self.cache.salvar_links(periodo, id_curso, departamento, todos_links)
+                
+        return todos_links
+
+    def analisar_turma(self, html):
+        """Extrai título, horários e todas as linhas de "Vagas Alocadas" de uma página de turma.
+
+        Usa a leitura rápida e, se a página não tiver a estrutura esperada, a árvore completa
+        (contada em `analise.turma.arvore_completa` nas métricas).
+        """
+        return analisar_turma(html, self.parser_html, lambda: self.metricas.contar('analise.turma.arvore_completa'))
+
+    def descobrir_cursos(self, validade=VALIDADE_CURSOS_PADRAO):
+        """Cursos oferecidos no formulário de busca ({nome: id}), guardados no cache local.
+
+        Não altera a consulta; para coletar todos: `consultor.ids_cursos = consultor.descobrir_cursos()`.
+        """
+        if self.cache:
+            cursos = self.cache.obter_cursos(self.base_url, validade)
+            if cursos:
+                return cursos
+        response = self._get(f"{self.base_url}/graduacao/quadrodehorarios/", fase='cursos')
+        response.raise_for_status()
+        cursos = analisar_cursos(response.text, self.parser_html)
+        if self.cache and cursos:
+            self.cache.salvar_cursos(self.base_url, cursos)
+        return cursos
+
+    @staticmethod
+    def curso_corresponde(curso_alvo, curso_nome):
+        """Verifica pelo nome se a linha da tabela de vagas pertence ao curso desejado.
+
+        Usado só quando a linha não traz o código do curso.
+        """
+        if curso_alvo == 'Química':
+            return '028' in curso_nome or ('Química' in curso_nome and 'Industrial' not in curso_nome)
+        if curso_alvo == 'Química Industrial':
+            return '029' in curso_nome or 'Industrial' in curso_nome
+        return curso_alvo.casefold() == curso_nome.casefold()
+
+    def indexar_vagas(self, vagas):
+        """{código: primeira linha de vagas} só das linhas cujo código é o id de um curso conhecido."""
+        conhecidos = {str(int(id_curso)) for id_curso in self.ids_cursos.values() if str(id_curso).isdigit()}
+        por_codigo = {}
+        for v in reversed(vagas):
+            if v.get('codigo_curso') in conhecidos:
+                por_codigo[v['codigo_curso']] = v
+        return por_codigo
+
+    def vagas_do_curso(self, vagas, curso_alvo, por_codigo=None):
+        """Primeira linha de vagas do curso: pelo código (id da busca) ou, sem código conhecido, pelo nome."""
+        if por_codigo is None:
+            por_codigo = self.indexar_vagas(vagas)
+        id_curso = self.ids_cursos.get(curso_alvo)
+        if id_curso and str(id_curso).isdigit():
+            vaga = por_codigo.get(str(int(id_curso)))
+            if vaga is not None:
+                return vaga
+        # Linhas sem código, ou com um número que não é id de curso conhecido (ex.: "Química (Niterói) - 2010")
+        return next((v for v in vagas if v.get('codigo_curso') not in por_codigo
+                     and self.curso_corresponde(curso_alvo, v['curso_nome'])), None)
+
+    def montar_registros(self, dados_turma, periodo, cursos_alvo):
+        """Gera um registro por curso encontrado na tabela de vagas da turma."""
+        registros = []
+        if not dados_turma:
+            return registros
+        # Índice por código compartilhado por todos os cursos da turma
+        por_codigo = self.indexar_vagas(dados_turma['vagas'])
+        for curso_alvo in cursos_alvo:
+            vagas_info = self.vagas_do_curso(dados_turma['vagas'], curso_alvo, por_codigo)
+            if not vagas_info:
+                continue
+            registros.append(RegistroTurma(
+                periodo=periodo,
+                curso=curso_alvo,
+                depto=dados_turma['depto'],
+                codigo=dados_turma['codigo'],
+                disciplina=dados_turma['disciplina'],
+                turma=dados_turma['turma'],
+                horario=dados_turma['horario'],
+                horario_bits=dados_turma['horario_bits'],
+                vagas_reg=vagas_info['vagas_reg'],
+                vagas_vest=vagas_info['vagas_vest'],
+                inscritos_reg=vagas_info['inscritos_reg'],
+                inscritos_vest=vagas_info['inscritos_vest'],
+            ))
+        return registros
+
+    def baixar_turma(self, url_turma):
+        """Baixa e analisa a página de uma turma (None em caso de erro)."""
+        try:
+            return self._baixar_e_analisar(url_turma, self.analisar_turma, 'turma')
+        except requests.exceptions.RequestException:
+            # Registrada para o aviso de planilha incompleta ao final da consulta
+            self.urls_com_falha.append(url_turma)
+            return None
+        except Exception:
+            # Erro de análise ou do cache local: a turma também conta como não carregada
+            logger.exception("Erro ao processar a turma %s", url_turma)
+            self.estatisticas.registrar('falhas')
+            self.metricas.contar('turma.erro')
+            self.urls_com_falha.append(url_turma)
+            return None
+
+    def extrair_dados_turma(self, url_turma, periodo, cursos_alvo):
+        """Extrai os dados de uma turma para vários cursos com um único download."""
+        return self.montar_registros(self.baixar_turma(url_turma), periodo, cursos_alvo)
+
+    def extrair_dados_turma_por_curso(self, url_turma, periodo, curso_alvo):
+        """Extrai dados de uma turma específica para um curso específico."""
+        registros = self.extrair_dados_turma(url_turma, periodo, [curso_alvo])
+        return registros[0] if registros else None
+
+    def _processar_turma(self, url_turma, alvos):
+        """Baixa a turma uma vez e gera os registros de todos os (período, cursos) que a encontraram."""
+        dados_por_periodo = {}
+        if self.cache:
+            for periodo in alvos:
+                dados_por_periodo[periodo] = self.cache.obter_turma(periodo, url_turma, self.validade_cache(periodo))
+                self.metricas.contar('cache.turmas.' + ('faltas' if dados_por_periodo[periodo] is None else 'acertos'))
+        
+        pendentes = [periodo for periodo in alvos if dados_por_periodo.get(periodo) is None]
+        if pendentes:
+            dados_turma = self.baixar_turma(url_turma)
+            for periodo in pendentes:
+                dados_por_periodo[periodo] = dados_turma
+                if self.cache and dados_turma:
+                    self.cache.salvar_turma(periodo, url_turma, dados_turma)
+        
+        registros = []
+        for periodo, cursos in alvos.items():
+            registros.extend(self.montar_registros(dados_por_periodo[periodo], periodo, cursos))
+        # Turmas vindas de uma busca sem filtro cujo código não apareceu na listagem
+        if self.plano and self.plano.filtro_departamentos is not None:
+            registros = [r for r in registros if self.plano.aceita(r['codigo'])]
+        return registros
+
+    def cursos_consultados(self):
+        """Nomes dos cursos da consulta: o do filtro ou todos de `ids_cursos`."""
+        return [self.curso_filtro] if self.curso_filtro else list(self.ids_cursos.keys())
+
+    def chave_consulta(self):
+        """Identifica a consulta (períodos, cursos e departamentos) para checkpoints."""
+        partes = [
+            ','.join(self.periodos),
+            ','.join(f"{curso}={self.ids_cursos.get(curso, '')}" for curso in sorted(self.cursos_consultados())),
+            ','.join(sorted(set(self.departamentos_filtro))),
+        ]
+        return hashlib.sha1('|'.join(partes).encode('utf-8')).hexdigest()
+
+    def planejar(self):
+        """Monta o plano de buscas da consulta (ver planejamento.planejar_buscas)."""
+        return planejar_buscas(
+            self.periodos,
+            [(curso, self.ids_cursos.get(curso, '28')) for curso in self.cursos_consultados()],
+            self.departamentos_filtro,
+            self.limiar_agrupamento,
+        )
+
+    def buscas_em_cache(self, plano):
+        """Quantas buscas do plano já têm os links no cache (não exigem requisições)."""
+        if not self.cache:
+            return 0
+        return sum(
+            self.cache.obter_links(periodo, id_curso, depto, self.validade_cache(periodo)) is not None
+            for periodo, id_curso, depto, _ in plano.buscas
+        )
+
+    def _coletar_links(self, progresso):
+        """Percorre as buscas do plano e retorna {link: {período: [cursos]}}.
+
+        Cada link guarda os (período, cursos) em que apareceu, para que a página
+        da turma seja baixada uma única vez. Em buscas sem filtro de departamento,
+        as turmas de outros departamentos são descartadas pelo código da listagem.
+        """
+        alvos_por_link = {}
+        for passo, (periodo, id_curso, depto, cursos_busca) in enumerate(self.plano.buscas, 1):
+            progress = passo / len(self.plano) * 0.5
+            descricao = f"{' e '.join(cursos_busca)} em {periodo[:4]}.{periodo[4]}" + (f" ({depto})" if depto else "")
+            progresso(progress, f"Buscando {descricao}...")
+            
+            for link, codigo in self.navegar_todas_paginas(id_curso, depto, periodo).items():
+                if not self.plano.aceita(codigo):
+                    continue
+                cursos = alvos_por_link.setdefault(link, {}).setdefault(periodo, [])
+                for curso in cursos_busca:
+                    if curso not in cursos:
+                        cursos.append(curso)
+        return alvos_por_link
+
+    def executar_consulta(self, progresso=None, ao_coletar=None, intervalo_progresso=0.25):
+        """Executa a consulta completa.
+
+        `progresso(fracao, mensagem)`, se informado, recebe o andamento da coleta, no
+        máximo uma vez a cada `intervalo_progresso` segundos. `ao_coletar(registros)`
+        recebe os registros de cada turma assim que ela é processada (na ordem em que
+        os downloads terminam); o retorno mantém a ordem dos links.
+
+        Com o cache ativo, o plano de turmas e as turmas concluídas são gravados em um
+        checkpoint: se a execução for interrompida, a mesma consulta retoma de onde parou.
+        Sem checkpoint quando alguma busca ficou incompleta (a próxima execução refaz as buscas).
+        Ao terminar, o checkpoint é descartado; só as turmas que falharam ficam pendentes
+        e são tentadas primeiro na próxima execução (que refaz as buscas normalmente).
+        """
+        progresso = ProgressoLimitado(progresso or (lambda fracao, mensagem: None), intervalo_progresso)
+        dados_brutos = []
+        self.estatisticas.zerar()
+        self.metricas.zerar()
+        self.urls_com_falha = []
+        self.buscas_incompletas = []
+        self.avisos = []
+        
+        self.plano = self.planejar()
+        em_cache = self.buscas_em_cache(self.plano)
+        logger.info("Plano da consulta: %s", self.plano.descrever(em_cache))
+        progresso(0.0, f"Plano: {self.plano.descrever(em_cache)}")
+        
+        # Primeira metade: coleta de links (ou plano salvo de uma execução interrompida)
+        chave = self.chave_consulta()
+        validade = self.validade_checkpoint
+        if self.validade_cache(max(self.periodos)) is not None:
+            # Com o período atual na consulta, registros salvos não podem durar mais que o cache dele
+            validade = min(validade, self.validade_cache(max(self.periodos)))
+        checkpoint = self.cache.obter_checkpoint(chave, validade) if self.cache else None
+        pendentes_anteriores = {}
+        if checkpoint:
+            alvos_por_link, concluidas = checkpoint
+            concluidas = {url: [RegistroTurma.de_dict(r) for r in registros] for url, registros in concluidas.items()}
+            self.metricas.contar('checkpoint.turmas_retomadas', len(concluidas))
+            progresso(0.5, f"Retomando consulta interrompida ({len(concluidas)}/{len(alvos_por_link)} turmas já coletadas)...")
+        else:
+            with self.metricas.medir('fase.listagens'):
+                alvos_por_link, concluidas = self._coletar_links(progresso), {}
+            if self.cache:
+                # Plano de buscas interrompidas não é salvo: a retomada o trataria como completo
+                if not self.buscas_incompletas:
+                    self.cache.iniciar_checkpoint(chave, alvos_por_link)
+                pendentes_anteriores = self.cache.obter_pendentes(chave, self.validade_checkpoint)
+                self.metricas.contar('checkpoint.turmas_pendentes', len(pendentes_anteriores))
+        progresso.descarregar()
+        com_checkpoint = self.cache and not self.buscas_incompletas
+        
+        # Segunda metade: processar as turmas em paralelo; o limitador controla a taxa de requisições
+        links = list(alvos_por_link)
+        total_links = len(links)
+        resultados = [None] * total_links
+        pendentes = []
+        for idx, link in enumerate(links):
+            if link in concluidas:
+                resultados[idx] = concluidas[link]
+                if ao_coletar and concluidas[link]:
+                    ao_coletar(concluidas[link])
+            else:
+                pendentes.append(idx)
+        # Turmas que falharam na execução anterior vão primeiro
+        pendentes.sort(key=lambda idx: links[idx] not in pendentes_anteriores)
+        
+        a_registrar = []  # turmas concluídas ainda não gravadas no checkpoint
+        ultima_gravacao = time.monotonic()
+        inicio_turmas = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futuros = {
+                executor.submit(self._processar_turma, links[idx], alvos_por_link[links[idx]]): idx
+                for idx in pendentes
+            }
+            for concluidos, futuro in enumerate(as_completed(futuros), total_links - len(pendentes) + 1):
+                idx = futuros[futuro]
+                registros = resultados[idx] = futuro.result()
+                # Turmas com falha de download ficam pendentes para a próxima execução
+                if com_checkpoint and links[idx] not in self.urls_com_falha:
+                    a_registrar.append((links[idx], registros))
+                    if len(a_registrar) >= 50 or time.monotonic() - ultima_gravacao >= 2.0:
+                        self.cache.registrar_checkpoint(chave, a_registrar)
+                        a_registrar, ultima_gravacao = [], time.monotonic()
+                if ao_coletar and registros:
+                    ao_coletar(registros)
+                progress = 0.5 + 0.5 * (concluidos / max(total_links, 1))
+                progresso(min(progress, 0.99), f"Processando turma {concluidos}/{total_links}...")
+        finally:
+            # Em caso de interrupção, não baixar as turmas que ainda não começaram
+            executor.shutdown(wait=True, cancel_futures=True)
+            if com_checkpoint:
+                self.cache.registrar_checkpoint(chave, a_registrar)
+            self.metricas.observar('fase.turmas', time.perf_counter() - inicio_turmas)
+        progresso.descarregar()
+        
+        # Manter a ordem original dos links nos resultados
+        for registros in resultados:
+            dados_brutos.extend(registros)
+        
+        if self.urls_com_falha:
+            self._avisar(logging.WARNING, f"{len(self.urls_com_falha)} turma(s) não puderam ser carregadas após "
+                                          "várias tentativas; a planilha pode estar incompleta.")
+        if self.cache:
+            self.cache.remover_checkpoint(chave)
+            self.cache.salvar_pendentes(chave, {
+                url: alvos_por_link[url] for url in self.urls_com_falha if url in alvos_por_link
+            })
+        
+        return dados_brutos
+
+    def consulta_incompleta(self):
+        """Se a última execução teve turmas não carregadas ou buscas interrompidas."""
+        return bool(self.urls_com_falha or self.buscas_incompletas)
+
+    def diagnostico(self):
+        """Contadores HTTP e métricas da última execução, serializáveis em JSON."""
+        return {'http': self.estatisticas.como_dict(), 'limitador': self.limitador.como_dict(), **self.metricas.como_dict()}
+
+    def gerar_excel_comparativo(self, dados):
+        """Gera planilha Excel comparativa."""
+        from .excel import gerar_excel_comparativo
+        with self.metricas.medir('exportacao.xlsx'):
+            return gerar_excel_comparativo(dados)
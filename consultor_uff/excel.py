@@ -0,0 +1,143 @@
+"""Exportação da planilha comparativa entre períodos."""
+
+import io
+
+COLUNAS_FIXAS = [
+    ('curso', 'Curso', 18),
+    ('depto', 'Depto', 8),
+    ('codigo', 'Código', 12),
+    ('disciplina', 'Disciplina', 35),
+    ('turma', 'Turma', 8),
+]
+SUB_COLS = [
+    ('horario', 'Horário'),
+    ('vagas_reg', 'Vagas Reg'),
+    ('inscritos_reg', 'Insc Reg'),
+    ('vagas_vest', 'Vagas Vest'),
+    ('inscritos_vest', 'Insc Vest')
+]
+
+
+def _registrar_estilos(wb):
+    """Registra os estilos nomeados da planilha (compartilhados por todas as células)."""
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+    from openpyxl.styles.fonts import DEFAULT_FONT
+
+    blue_fill = PatternFill(start_color="337AB7", end_color="337AB7", fill_type="solid")
+    beige_fill = PatternFill(start_color="FDFDF0", end_color="FDFDF0", fill_type="solid")
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    center = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+    estilos = {
+        'cabecalho': dict(fill=blue_fill, font=Font(color="FFFFFF", bold=True, size=11), alignment=center),
+        'subcabecalho': dict(fill=blue_fill, font=Font(color="FFFFFF", bold=False, size=9), alignment=center),
+        'chave': dict(alignment=center),
+        'chave_texto': dict(alignment=Alignment(horizontal='left', vertical='center')),
+        'valor_periodo': dict(alignment=center, fill=beige_fill),
+    }
+    for nome, atributos in estilos.items():
+        atributos.setdefault('font', DEFAULT_FONT)
+        estilo = NamedStyle(name=nome, border=border, **atributos)
+        wb.add_named_style(estilo)
+
+
+def linhas_comparativo(df, periodos_ordenados):
+    """Gera as linhas de dados: chaves da turma seguidas dos valores de cada período.
+
+    A matriz turma x período é montada de uma vez (unstack), com as subcolunas como
+    segundo nível das colunas e '-' nos períodos em que a turma não aparece.
+    """
+    import pandas as pd
+
+    chaves = [chave for chave, _, _ in COLUNAS_FIXAS]
+    valores = [chave for chave, _ in SUB_COLS]
+
+    # Primeiro registro de cada turma em cada período
+    matriz = (
+        df.drop_duplicates(chaves + ['periodo'])
+        .set_index(chaves + ['periodo'])[valores]
+        .astype(object)
+        .unstack('periodo')
+        .swaplevel(axis=1)
+        .reindex(columns=pd.MultiIndex.from_product([periodos_ordenados, valores]))
+        .sort_index()
+        .fillna('-')
+    )
+
+    for linha in matriz.itertuples(index=True, name=None):
+        yield (*linha[0], *linha[1:])
+
+
+def escrever_comparativo(linhas, periodos_ordenados, destino):
+    """Grava a planilha em modo streaming (write_only), linha a linha, em `destino`.
+
+    O cabeçalho ocupa duas linhas mescladas: colunas fixas e, para cada período,
+    as subcolunas de horário, vagas e inscritos.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Comparativo de Períodos")
+    _registrar_estilos(wb)
+
+    def celula(valor, estilo):
+        cell = WriteOnlyCell(ws, value=valor)
+        cell.style = estilo
+        return cell
+
+    # Ajustar larguras (precisa ser feito antes de gravar as linhas)
+    for col_idx, (_, _, largura) in enumerate(COLUNAS_FIXAS, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = largura
+
+    # Cabeçalhos fixos e de períodos
+    n_fixas = len(COLUNAS_FIXAS)
+    linha1 = [celula(titulo, 'cabecalho') for _, titulo, _ in COLUNAS_FIXAS]
+    linha2 = [None] * n_fixas
+    for col_idx in range(1, n_fixas + 1):
+        ws.merged_cells.add(f"{get_column_letter(col_idx)}1:{get_column_letter(col_idx)}2")
+
+    current_col = n_fixas + 1
+    for per in periodos_ordenados:
+        linha1.append(celula(f"{per[:4]}.{per[4]}", 'cabecalho'))
+        linha1.extend([None] * (len(SUB_COLS) - 1))
+        ws.merged_cells.add(f"{get_column_letter(current_col)}1:{get_column_letter(current_col + len(SUB_COLS) - 1)}1")
+        linha2.extend(celula(titulo, 'subcabecalho') for _, titulo in SUB_COLS)
+        current_col += len(SUB_COLS)
+    ws.append(linha1)
+    ws.append(linha2)
+
+    # Dados: as células de cada coluna são reaproveitadas (já estilizadas), pois
+    # no modo write_only cada linha é gravada no momento do append
+    estilos = ['chave_texto' if chave == 'disciplina' else 'chave' for chave, _, _ in COLUNAS_FIXAS]
+    estilos += ['valor_periodo'] * (len(SUB_COLS) * len(periodos_ordenados))
+    modelos = [celula(None, estilo) for estilo in estilos]
+    for vals in linhas:
+        for cell, val in zip(modelos, vals):
+            cell.value = val
+        ws.append(modelos)
+
+    wb.save(destino)
+
+
+def gerar_excel_comparativo(dados):
+    """Gera planilha Excel comparativa (BytesIO), ou None se não houver dados."""
+    if not dados:
+        return None
+
+    # Importado só na exportação: mantém rápida a importação do pacote
+    from .exportacao import dados_para_dataframe
+
+    df = dados_para_dataframe(dados)
+    periodos_ordenados = sorted(df['periodo'].cat.categories, reverse=True)
+
+    buffer = io.BytesIO()
+    escrever_comparativo(linhas_comparativo(df, periodos_ordenados), periodos_ordenados, buffer)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,85 @@
+"""Exportação dos registros coletados em formatos tabulares (XLSX, Parquet, CSV, JSON Lines)."""
+
+import io
+
+COLUNAS_EXPORTACAO = [
+    'periodo', 'curso', 'depto', 'codigo', 'disciplina', 'turma', 'horario',
+    'vagas_reg', 'vagas_vest', 'inscritos_reg', 'inscritos_vest',
+]
+COLUNAS_INTEIRAS = ['vagas_reg', 'vagas_vest', 'inscritos_reg', 'inscritos_vest']
+# Poucos valores distintos repetidos em muitas linhas: guardados como categorias
+COLUNAS_CATEGORICAS = ['periodo', 'curso', 'depto', 'codigo']
+
+
+def dados_para_dataframe(dados):
+    """Monta o DataFrame dos registros com as colunas de exportação e tipos compactos.
+
+    As colunas são montadas uma a uma a partir dos registros (dicionários ou
+    RegistroTurma), sem DataFrame intermediário de objetos: categorias para os textos
+    repetidos e int16 para vagas e inscritos.
+    """
+    import numpy as np
+    import pandas as pd
+
+    dados = list(dados)
+    colunas = {}
+    for coluna in COLUNAS_EXPORTACAO:
+        valores = [registro[coluna] for registro in dados]
+        if coluna in COLUNAS_CATEGORICAS:
+            colunas[coluna] = pd.Categorical(valores)
+        elif coluna in COLUNAS_INTEIRAS:
+            colunas[coluna] = np.array(valores, dtype=np.int16)
+        else:
+            colunas[coluna] = np.array(valores, dtype=object)
+    return pd.DataFrame(colunas, columns=COLUNAS_EXPORTACAO, copy=False)
+
+
+def gerar_csv(dados):
+    """Registros em CSV (UTF-8, uma linha por turma/curso/período)."""
+    buffer = io.BytesIO()
+    dados_para_dataframe(dados).to_csv(buffer, index=False, encoding='utf-8')
+    buffer.seek(0)
+    return buffer
+
+
+def gerar_jsonl(dados):
+    """Registros em JSON Lines (um objeto por linha)."""
+    buffer = io.BytesIO()
+    texto = dados_para_dataframe(dados).to_json(orient='records', lines=True, force_ascii=False)
+    buffer.write(texto.encode('utf-8'))
+    buffer.seek(0)
+    return buffer
+
+
+def gerar_parquet(dados):
+    """Registros em Parquet com colunas tipadas (requer pyarrow)."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError("A exportação em Parquet requer o pacote pyarrow (pip install pyarrow).") from e
+    buffer = io.BytesIO()
+    dados_para_dataframe(dados).to_parquet(buffer, index=False)
+    buffer.seek(0)
+    return buffer
+
+
+def gerar_xlsx(dados):
+    """Planilha comparativa entre períodos (o mesmo arquivo do botão principal)."""
+    from .excel import gerar_excel_comparativo
+    return gerar_excel_comparativo(dados)
+
+
+# formato -> (função, extensão, tipo MIME, rótulo)
+FORMATOS = {
+    'xlsx': (gerar_xlsx, '.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'Excel'),
+    'parquet': (gerar_parquet, '.parquet', 'application/vnd.apache.parquet', 'Parquet'),
+    'csv': (gerar_csv, '.csv', 'text/csv', 'CSV'),
+    'jsonl': (gerar_jsonl, '.jsonl', 'application/jsonl', 'JSON Lines'),
+}
+
+
+def exportar(dados, formato):
+    """Gera o arquivo do formato pedido (BytesIO); ValueError para formato desconhecido."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato!r} (use {', '.join(FORMATOS)})")
+    return FORMATOS[formato][0](dados)
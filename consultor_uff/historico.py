@@ -0,0 +1,163 @@
+"""Histórico de capturas de vagas e inscritos (evolução durante a inscrição em disciplinas).
+
+Cada execução pode ser registrada como uma captura. As turmas são identificadas por
+(período, código, turma, curso) e só os valores que mudaram desde a captura anterior
+são gravados: a série de uma turma é a sequência de suas mudanças.
+
+Os valores ficam em uma tabela SQLite sem rowid, ordenada por (turma, captura), de
+modo que a série de uma turma é lida de um trecho contíguo do arquivo.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+CAMINHO_HISTORICO_PADRAO = os.environ.get(
+    'CONSULTOR_UFF_HISTORICO',
+    os.path.join(os.path.expanduser('~'), '.local', 'share', 'consultor_uff', 'historico.sqlite3')
+)
+
+CAMPOS_VALORES = ['vagas_reg', 'vagas_vest', 'inscritos_reg', 'inscritos_vest']
+
+
+class HistoricoInscritos:
+    """Capturas de vagas/inscritos em SQLite, gravando só as mudanças de cada turma."""
+
+    def __init__(self, caminho=CAMINHO_HISTORICO_PADRAO):
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(caminho, check_same_thread=False, timeout=60)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS capturas ("
+                " id INTEGER PRIMARY KEY, momento REAL NOT NULL, registros INTEGER NOT NULL,"
+                " alteracoes INTEGER NOT NULL)"
+            )
+            # Uma linha por turma/curso, com os últimos valores (base de comparação da próxima captura)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS chaves ("
+                " id INTEGER PRIMARY KEY, periodo TEXT NOT NULL, codigo TEXT NOT NULL, turma TEXT NOT NULL,"
+                " curso TEXT NOT NULL, depto TEXT, disciplina TEXT, horario TEXT,"
+                " vagas_reg INTEGER, vagas_vest INTEGER, inscritos_reg INTEGER, inscritos_vest INTEGER,"
+                " UNIQUE (periodo, codigo, turma, curso))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS valores ("
+                " chave INTEGER NOT NULL, captura INTEGER NOT NULL,"
+                " vagas_reg INTEGER, vagas_vest INTEGER, inscritos_reg INTEGER, inscritos_vest INTEGER,"
+                " PRIMARY KEY (chave, captura)) WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS valores_captura ON valores (captura)")
+
+    def registrar_captura(self, dados, momento=None):
+        """Registra os registros de uma consulta; retorna (id da captura, turmas alteradas ou novas).
+
+        Turmas ausentes da captura (ex.: consulta com outros filtros) mantêm o último valor.
+        """
+        momento = time.time() if momento is None else momento
+        with self._lock, self._conn:
+            existentes = {
+                (periodo, codigo, turma, curso): (id_chave, valores)
+                for id_chave, periodo, codigo, turma, curso, *valores in self._conn.execute(
+                    "SELECT id, periodo, codigo, turma, curso, vagas_reg, vagas_vest, inscritos_reg, inscritos_vest"
+                    " FROM chaves"
+                )
+            }
+            captura = self._conn.execute(
+                "INSERT INTO capturas (momento, registros, alteracoes) VALUES (?, ?, 0)", (momento, len(dados))
+            ).lastrowid
+
+            alteracoes = []
+            vistas = set()
+            for registro in dados:
+                chave = (registro['periodo'], registro['codigo'], registro['turma'], registro['curso'])
+                if chave in vistas:
+                    continue
+                vistas.add(chave)
+                valores = [registro[campo] for campo in CAMPOS_VALORES]
+                descricao = (registro.get('depto'), registro.get('disciplina'), registro.get('horario'))
+                if chave not in existentes:
+                    id_chave = self._conn.execute(
+                        "INSERT INTO chaves (periodo, codigo, turma, curso, depto, disciplina, horario,"
+                        " vagas_reg, vagas_vest, inscritos_reg, inscritos_vest)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (*chave, *descricao, *valores)
+                    ).lastrowid
+                elif list(existentes[chave][1]) != valores:
+                    id_chave = existentes[chave][0]
+                    self._conn.execute(
+                        "UPDATE chaves SET depto = ?, disciplina = ?, horario = ?, vagas_reg = ?, vagas_vest = ?,"
+                        " inscritos_reg = ?, inscritos_vest = ? WHERE id = ?",
+                        (*descricao, *valores, id_chave)
+                    )
+                else:
+                    continue
+                alteracoes.append((id_chave, captura, *valores))
+
+            self._conn.executemany("INSERT INTO valores VALUES (?, ?, ?, ?, ?, ?)", alteracoes)
+            self._conn.execute("UPDATE capturas SET alteracoes = ? WHERE id = ?", (len(alteracoes), captura))
+        return captura, len(alteracoes)
+
+    def capturas(self):
+        """Lista de (id, momento, registros, alterações) em ordem cronológica."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, momento, registros, alteracoes FROM capturas ORDER BY id"
+            ).fetchall()
+
+    def serie(self, periodo, codigo, turma, curso=None):
+        """Evolução de uma turma: {curso: [(momento, vagas_reg, vagas_vest, inscritos_reg, inscritos_vest)]}.
+
+        Só as capturas em que algum valor mudou aparecem (os valores valem até a mudança seguinte).
+        """
+        sql = (
+            "SELECT c.curso, cap.momento, v.vagas_reg, v.vagas_vest, v.inscritos_reg, v.inscritos_vest"
+            " FROM chaves c JOIN valores v ON v.chave = c.id JOIN capturas cap ON cap.id = v.captura"
+            " WHERE c.periodo = ? AND c.codigo = ? AND c.turma = ?"
+        )
+        params = [periodo, codigo, turma]
+        if curso is not None:
+            sql += " AND c.curso = ?"
+            params.append(curso)
+        with self._lock:
+            linhas = self._conn.execute(sql + " ORDER BY c.curso, v.captura", params).fetchall()
+        series = {}
+        for curso_linha, *valores in linhas:
+            series.setdefault(curso_linha, []).append(tuple(valores))
+        return series
+
+    def alteradas_desde(self, captura=None):
+        """Turmas cujos inscritos mudaram após a captura informada (padrão: a penúltima).
+
+        Retorna dicionários com a chave da turma, os inscritos na captura de referência
+        (None para turmas novas) e os atuais.
+        """
+        with self._lock:
+            if captura is None:
+                ids = [linha[0] for linha in self._conn.execute("SELECT id FROM capturas ORDER BY id DESC LIMIT 2")]
+                captura = ids[1] if len(ids) > 1 else 0
+            linhas = self._conn.execute(
+                "SELECT c.periodo, c.codigo, c.turma, c.curso, c.disciplina, c.inscritos_reg, c.inscritos_vest,"
+                " (SELECT inscritos_reg FROM valores WHERE chave = c.id AND captura <= ? ORDER BY captura DESC LIMIT 1),"
+                " (SELECT inscritos_vest FROM valores WHERE chave = c.id AND captura <= ? ORDER BY captura DESC LIMIT 1)"
+                " FROM chaves c WHERE c.id IN (SELECT DISTINCT chave FROM valores WHERE captura > ?)"
+                " ORDER BY c.periodo, c.codigo, c.turma, c.curso",
+                (captura, captura, captura)
+            ).fetchall()
+        alteradas = []
+        for periodo, codigo, turma, curso, disciplina, reg, vest, reg_antes, vest_antes in linhas:
+            if (reg, vest) == (reg_antes, vest_antes):
+                continue  # só as vagas mudaram
+            alteradas.append({
+                'periodo': periodo, 'codigo': codigo, 'turma': turma, 'curso': curso, 'disciplina': disciplina,
+                'inscritos_reg_antes': reg_antes, 'inscritos_vest_antes': vest_antes,
+                'inscritos_reg': reg, 'inscritos_vest': vest,
+            })
+        return alteradas
+
+    def fechar(self):
+        with self._lock:
+            self._conn.close()
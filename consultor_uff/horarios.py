@@ -0,0 +1,106 @@
+"""Horários das turmas como conjuntos de faixas (bits) e detecção de choques entre turmas.
+
+Cada turma tem um inteiro em que o bit `dia * FAIXAS_POR_DIA + faixa` indica a
+ocupação da faixa de dez minutos (07h às 23h, segunda a sábado). Os intervalos são
+semiabertos: 08:00-09:30 e 09:30-11:00 não se chocam. Dois horários se chocam
+quando têm algum bit em comum; a matriz de choques é calculada com NumPy sobre os
+horários distintos, o que atende milhares de turmas de uma vez.
+"""
+
+import re
+
+DIAS = ['Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb']
+HORA_INICIAL = 7
+MINUTOS_POR_FAIXA = 10
+FAIXAS_POR_DIA = 16 * 60 // MINUTOS_POR_FAIXA  # 07h-23h
+
+RE_DIA = re.compile(r'(Seg|Ter|Qua|Qui|Sex|Sáb)\s*:\s*([^|]*)')
+RE_INTERVALO = re.compile(r'(\d{1,2})\s*[:h]\s*(\d{2})\s*(?:-|–|às|a)\s*(\d{1,2})\s*[:h]\s*(\d{2})')
+
+# Colunas do resumo de conflitos_entre_disciplinas
+CAMPOS_CONFLITOS = [
+    'periodo', 'codigo_a', 'disciplina_a', 'codigo_b', 'disciplina_b',
+    'combinacoes_em_conflito', 'combinacoes', 'inevitavel',
+]
+
+
+def codificar_horario(horario):
+    """Converte o texto 'Seg: 08:00-10:00 | Qua: ...' no inteiro de faixas ocupadas (0 se não houver)."""
+    bits = 0
+    for dia, intervalos in RE_DIA.findall(horario or ''):
+        deslocamento = DIAS.index(dia) * FAIXAS_POR_DIA
+        for h1, m1, h2, m2 in RE_INTERVALO.findall(intervalos):
+            inicio = (int(h1) - HORA_INICIAL) * 60 + int(m1)
+            fim = (int(h2) - HORA_INICIAL) * 60 + int(m2)
+            # Faixas tocadas por [início, fim): o minuto final não é ocupado
+            primeira = max(0, inicio // MINUTOS_POR_FAIXA)
+            ultima = min(FAIXAS_POR_DIA, -(-fim // MINUTOS_POR_FAIXA))
+            for faixa in range(primeira, ultima):
+                bits |= 1 << (deslocamento + faixa)
+    return bits
+
+
+def _matriz_faixas(bits):
+    """Matriz (n horários x faixas) de 0/1 em float32, para o produto matricial."""
+    import numpy as np
+
+    total = len(DIAS) * FAIXAS_POR_DIA
+    dados = b''.join(int(b).to_bytes((total + 7) // 8, 'little') for b in bits)
+    return np.unpackbits(np.frombuffer(dados, dtype=np.uint8).reshape(len(bits), -1), axis=1,
+                         bitorder='little')[:, :total].astype(np.float32)
+
+
+def _turmas_por_periodo(dados, disciplinas=None):
+    """{período: [(código, turma, disciplina, horário, bits)]}, uma entrada por turma (sem repetir cursos)."""
+    filtro = {d.strip().upper() for d in disciplinas} if disciplinas else None
+    por_periodo = {}
+    vistas = set()
+    for registro in dados:
+        chave = (registro['periodo'], registro['codigo'], registro['turma'])
+        if chave in vistas or (filtro and registro['codigo'] not in filtro):
+            continue
+        vistas.add(chave)
+        bits = registro.get('horario_bits')
+        if bits is None:
+            bits = codificar_horario(registro['horario'])
+        if bits:
+            por_periodo.setdefault(registro['periodo'], []).append(
+                (registro['codigo'], registro['turma'], registro['disciplina'], registro['horario'], bits)
+            )
+    return por_periodo
+
+
+def conflitos_entre_disciplinas(dados, disciplinas=None):
+    """Resumo por par de disciplinas: combinações de turmas que se chocam e se o choque é inevitável.
+
+    O choque é inevitável quando todas as combinações de turmas das duas disciplinas se
+    chocam. As contagens saem de produtos matriciais (disciplinas x horários distintos),
+    sem listar os pares de turmas.
+    """
+    import numpy as np
+
+    resumo = []
+    for periodo, turmas in sorted(_turmas_por_periodo(dados, disciplinas).items()):
+        codigos = sorted({t[0] for t in turmas})
+        nomes = {t[0]: t[2] for t in turmas}
+        indice_codigo = {codigo: i for i, codigo in enumerate(codigos)}
+        distintos, indice_horario = np.unique(np.array([int(t[4]) for t in turmas], dtype=object),
+                                              return_inverse=True)
+        faixas = _matriz_faixas(list(distintos))
+        choques = ((faixas @ faixas.T) > 0).astype(np.float32)
+        # Turmas de cada disciplina em cada horário distinto
+        contagem = np.zeros((len(codigos), len(distintos)), dtype=np.float32)
+        np.add.at(contagem, ([indice_codigo[t[0]] for t in turmas], indice_horario), 1)
+        em_conflito = np.rint(contagem @ choques @ contagem.T).astype(np.int64)
+        por_disciplina = contagem.sum(axis=1).astype(np.int64)
+        for a, b in zip(*np.nonzero(np.triu(em_conflito, k=1))):
+            combinacoes = int(por_disciplina[a] * por_disciplina[b])
+            resumo.append({
+                'periodo': periodo,
+                'codigo_a': codigos[a], 'disciplina_a': nomes[codigos[a]],
+                'codigo_b': codigos[b], 'disciplina_b': nomes[codigos[b]],
+                'combinacoes_em_conflito': int(em_conflito[a, b]),
+                'combinacoes': combinacoes,
+                'inevitavel': int(em_conflito[a, b]) == combinacoes,
+            })
+    return resumo
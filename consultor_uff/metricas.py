@@ -0,0 +1,117 @@
+"""Métricas de uma execução: contadores e histogramas de latência por fase (diagnóstico)."""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# Limites superiores (s) das faixas dos histogramas de latência
+FAIXAS_LATENCIA = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _arredondar(segundos):
+    return round(segundos, 6) if segundos is not None else None
+
+
+class Histograma:
+    """Contagem de observações por faixa de latência, com total, mínimo e máximo."""
+
+    def __init__(self):
+        self.contagens = [0] * (len(FAIXAS_LATENCIA) + 1)
+        self.quantidade = 0
+        self.total = 0.0
+        self.minimo = None
+        self.maximo = None
+
+    def observar(self, segundos):
+        self.contagens[bisect.bisect_left(FAIXAS_LATENCIA, segundos)] += 1
+        self.quantidade += 1
+        self.total += segundos
+        self.minimo = segundos if self.minimo is None else min(self.minimo, segundos)
+        self.maximo = segundos if self.maximo is None else max(self.maximo, segundos)
+
+    def percentil(self, fracao):
+        """Limite superior da faixa que contém o percentil (estimativa; o máximo na última faixa)."""
+        if not self.quantidade:
+            return None
+        alvo = fracao * self.quantidade
+        acumulado = 0
+        for indice, contagem in enumerate(self.contagens):
+            acumulado += contagem
+            if acumulado >= alvo and contagem:
+                return min(FAIXAS_LATENCIA[indice], self.maximo) if indice < len(FAIXAS_LATENCIA) else self.maximo
+        return self.maximo
+
+    def como_dict(self):
+        faixas = [f"<={limite:g}s" for limite in FAIXAS_LATENCIA] + [f">{FAIXAS_LATENCIA[-1]:g}s"]
+        return {
+            'quantidade': self.quantidade,
+            'total_s': round(self.total, 6),
+            'media_s': round(self.total / self.quantidade, 6) if self.quantidade else None,
+            'min_s': _arredondar(self.minimo),
+            'max_s': _arredondar(self.maximo),
+            'p50_s': _arredondar(self.percentil(0.5)),
+            'p95_s': _arredondar(self.percentil(0.95)),
+            'histograma': {faixa: n for faixa, n in zip(faixas, self.contagens) if n},
+        }
+
+
+class Metricas:
+    """Contadores e histogramas de latência nomeados de uma execução (thread-safe).
+
+    Os nomes seguem o padrão "grupo.item" (ex.: "http.turma", "cache.turmas.acertos").
+    Contadores "<prefixo>.acertos" e "<prefixo>.faltas" geram a taxa de acerto do prefixo.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.zerar()
+
+    def zerar(self):
+        with self._lock:
+            self.contadores = {}
+            self.histogramas = {}
+            self._inicio = time.monotonic()
+
+    def contar(self, nome, quantidade=1):
+        with self._lock:
+            self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+
+    def observar(self, nome, segundos):
+        with self._lock:
+            histograma = self.histogramas.get(nome)
+            if histograma is None:
+                histograma = self.histogramas[nome] = Histograma()
+            histograma.observar(segundos)
+
+    @contextmanager
+    def medir(self, nome):
+        """Registra no histograma `nome` a duração do bloco (mesmo se ele levantar exceção)."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(nome, time.perf_counter() - inicio)
+
+    def taxas_acerto(self):
+        """{prefixo: fração de acertos} para cada par de contadores acertos/faltas."""
+        with self._lock:
+            contadores = dict(self.contadores)
+        prefixos = sorted({nome.rsplit('.', 1)[0] for nome in contadores if nome.endswith(('.acertos', '.faltas'))})
+        taxas = {}
+        for prefixo in prefixos:
+            acertos = contadores.get(prefixo + '.acertos', 0)
+            total = acertos + contadores.get(prefixo + '.faltas', 0)
+            taxas[prefixo] = round(acertos / total, 4) if total else None
+        return taxas
+
+    def como_dict(self):
+        """Retrato serializável em JSON das métricas."""
+        taxas = self.taxas_acerto()
+        with self._lock:
+            return {
+                'duracao_s': round(time.monotonic() - self._inicio, 6),
+                'contadores': dict(sorted(self.contadores.items())),
+                'fases': {nome: h.como_dict() for nome, h in sorted(self.histogramas.items())},
+                'taxas_acerto': taxas,
+            }
@@ -0,0 +1,167 @@
+"""Monitoramento contínuo de vagas e inscritos com poucas requisições.
+
+Uma varredura das buscas define o conjunto de turmas; depois só as páginas das
+turmas são consultadas de novo, cada uma no seu ritmo: turmas quase lotadas ou
+que acabaram de mudar voltam logo para a fila, turmas estáveis e vazias esperam
+cada vez mais. Novas varreduras das buscas são raras. Cada mudança gera um evento.
+"""
+
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+INTERVALO_MINIMO_PADRAO = 60  # segundos
+INTERVALO_MAXIMO_PADRAO = 30 * 60
+INTERVALO_VARREDURA_PADRAO = 6 * 3600
+
+CAMPOS_MONITORADOS = ['vagas_reg', 'vagas_vest', 'inscritos_reg', 'inscritos_vest']
+
+
+class MonitorTurmas:
+    """Reconsulta as turmas de um ConsultorQuadroHorariosUFF por ordem de prioridade.
+
+    `ao_mudar(evento)` recebe um dicionário por registro novo, alterado ou removido:
+    tipo ('nova', 'alterada', 'removida'), momento, chave da turma (período, curso,
+    código, turma), disciplina e os valores antes/depois.
+    """
+
+    def __init__(self, consultor, ao_mudar=None, intervalo_minimo=INTERVALO_MINIMO_PADRAO,
+                 intervalo_maximo=INTERVALO_MAXIMO_PADRAO, intervalo_varredura=INTERVALO_VARREDURA_PADRAO):
+        self.consultor = consultor
+        self.ao_mudar = ao_mudar or (lambda evento: None)
+        self.intervalo_minimo = intervalo_minimo
+        self.intervalo_maximo = max(intervalo_maximo, intervalo_minimo)
+        self.intervalo_varredura = intervalo_varredura
+        self.parar = threading.Event()
+        self.alvos = {}  # link -> {período: [cursos]}
+        self.registros = {}  # link -> {(período, curso, código, turma): registro}
+        self.intervalos = {}  # link -> intervalo atual (s)
+        self._fila = []  # (momento da próxima consulta, link)
+        self._proxima_varredura = 0.0
+
+    def intervalo_base(self, registros):
+        """Intervalo pela ocupação: turmas quase lotadas perto do mínimo, vazias no máximo."""
+        vagas = sum(r['vagas_reg'] + r['vagas_vest'] for r in registros)
+        inscritos = sum(r['inscritos_reg'] + r['inscritos_vest'] for r in registros)
+        ocupacao = min(1.0, inscritos / vagas) if vagas else 0.0
+        return max(self.intervalo_minimo, self.intervalo_maximo * (1.0 - ocupacao))
+
+    def proximo_intervalo(self, link, registros, mudou):
+        """Mudou: volta no intervalo mínimo; sem mudança: dobra, até o intervalo da ocupação."""
+        if mudou:
+            intervalo = self.intervalo_minimo
+        else:
+            anterior = self.intervalos.get(link)
+            base = self.intervalo_base(registros)
+            intervalo = base if anterior is None else min(base, max(anterior * 2, self.intervalo_minimo))
+        self.intervalos[link] = intervalo
+        return intervalo
+
+    def _emitir(self, tipo, registro, antes=None, depois=None):
+        self.consultor.metricas.contar(f'monitor.eventos.{tipo}')
+        self.ao_mudar({
+            'tipo': tipo,
+            'momento': time.time(),
+            'periodo': registro['periodo'],
+            'curso': registro['curso'],
+            'codigo': registro['codigo'],
+            'turma': registro['turma'],
+            'disciplina': registro['disciplina'],
+            'antes': antes,
+            'depois': depois,
+        })
+
+    def varrer(self):
+        """Percorre as buscas e atualiza o conjunto de turmas (novas entram na fila já).
+
+        Se alguma busca ficar incompleta, as turmas que não apareceram são mantidas
+        (não há como saber se foram removidas) e a próxima varredura vem logo.
+        """
+        consultor = self.consultor
+        consultor.urls_com_falha = []
+        consultor.buscas_incompletas = []
+        consultor.plano = consultor.planejar()
+        alvos = consultor._coletar_links(lambda fracao, mensagem: None)
+        consultor.metricas.contar('monitor.varreduras')
+        agora = time.monotonic()
+        for link in alvos:
+            if link not in self.alvos:
+                heapq.heappush(self._fila, (agora, link))
+        if consultor.buscas_incompletas:
+            consultor.metricas.contar('monitor.varreduras_incompletas')
+            for link, por_periodo in alvos.items():
+                atuais = self.alvos.setdefault(link, {})
+                for periodo, cursos in por_periodo.items():
+                    atuais.setdefault(periodo, [])
+                    atuais[periodo] += [curso for curso in cursos if curso not in atuais[periodo]]
+            self._proxima_varredura = agora + self.intervalo_minimo
+            return
+        for link in set(self.alvos) - set(alvos):
+            for registro in self.registros.pop(link, {}).values():
+                self._emitir('removida', registro, antes={c: registro[c] for c in CAMPOS_MONITORADOS})
+            self.intervalos.pop(link, None)
+        self.alvos = alvos
+        self._proxima_varredura = agora + self.intervalo_varredura
+
+    def consultar(self, link):
+        """Baixa a turma de novo, emite os eventos e devolve se algo mudou (None em caso de falha)."""
+        consultor = self.consultor
+        consultor.metricas.contar('monitor.consultas')
+        dados_turma = consultor.baixar_turma(link)
+        if dados_turma is None:
+            return None
+        atuais = {}
+        for periodo, cursos in self.alvos.get(link, {}).items():
+            for registro in consultor.montar_registros(dados_turma, periodo, cursos):
+                atuais[(registro['periodo'], registro['curso'], registro['codigo'], registro['turma'])] = registro
+
+        anteriores = self.registros.get(link)
+        mudou = False
+        for chave, registro in atuais.items():
+            depois = {c: registro[c] for c in CAMPOS_MONITORADOS}
+            if anteriores is None:
+                continue  # primeira consulta: só a linha de base
+            if chave not in anteriores:
+                self._emitir('nova', registro, depois=depois)
+                mudou = True
+                continue
+            antes = {c: anteriores[chave][c] for c in CAMPOS_MONITORADOS}
+            if antes != depois:
+                self._emitir('alterada', registro, antes, depois)
+                mudou = True
+        for chave in set(anteriores or {}) - set(atuais):
+            registro = anteriores[chave]
+            self._emitir('removida', registro, antes={c: registro[c] for c in CAMPOS_MONITORADOS})
+            mudou = True
+        self.registros[link] = atuais
+        return mudou
+
+    def executar(self, duracao=None):
+        """Monitora até `parar` ser acionado (ou por `duracao` segundos).
+
+        As turmas vencidas em cada rodada são consultadas em paralelo (sob o mesmo
+        limite de requisições do consultor).
+        """
+        fim = time.monotonic() + duracao if duracao else None
+        with ThreadPoolExecutor(max_workers=self.consultor.max_workers) as executor:
+            while not self.parar.is_set() and (fim is None or time.monotonic() < fim):
+                agora = time.monotonic()
+                if agora >= self._proxima_varredura:
+                    self.varrer()
+                vencidos = []
+                while self._fila and self._fila[0][0] <= agora:
+                    _, link = heapq.heappop(self._fila)
+                    if link in self.alvos:
+                        vencidos.append(link)
+                for link, mudou in zip(vencidos, executor.map(self.consultar, vencidos)):
+                    registros = list(self.registros.get(link, {}).values())
+                    # Falha de download: nova tentativa no intervalo mínimo
+                    intervalo = self.intervalo_minimo if mudou is None else self.proximo_intervalo(link, registros, mudou)
+                    heapq.heappush(self._fila, (time.monotonic() + intervalo, link))
+                proximo = min(self._fila[0][0] if self._fila else self._proxima_varredura, self._proxima_varredura)
+                espera = proximo - time.monotonic()
+                if fim is not None:
+                    espera = min(espera, fim - time.monotonic())
+                if espera > 0:
+                    self.parar.wait(espera)
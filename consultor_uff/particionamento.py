@@ -0,0 +1,72 @@
+"""Coleta particionada: períodos e grupos de cursos distribuídos entre processos.
+
+Cada partição (um período e até `cursos_por_particao` cursos) roda um
+ConsultorQuadroHorariosUFF próprio em um processo separado, com a taxa de
+requisições dividida entre os processos. O cache SQLite é compartilhado, então
+turmas já baixadas por uma partição são reaproveitadas pelas outras.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .consultor import ConsultorQuadroHorariosUFF
+from .transporte import REQUISICOES_POR_SEGUNDO_MAX_PADRAO, REQUISICOES_POR_SEGUNDO_PADRAO
+
+CURSOS_POR_PARTICAO_PADRAO = 10
+
+
+def particionar(periodos, cursos, cursos_por_particao=CURSOS_POR_PARTICAO_PADRAO):
+    """Lista de (período, [cursos]) com no máximo `cursos_por_particao` cursos cada."""
+    tamanho = max(1, cursos_por_particao)
+    return [
+        (periodo, cursos[inicio:inicio + tamanho])
+        for periodo in periodos
+        for inicio in range(0, len(cursos), tamanho)
+    ]
+
+
+def _executar_particao(periodo, ids_cursos, departamentos_filtro, opcoes):
+    """Executa uma partição (no processo filho): (registros, diagnóstico, avisos)."""
+    consultor = ConsultorQuadroHorariosUFF([periodo], None, departamentos_filtro, ids_cursos=ids_cursos, **opcoes)
+    dados = consultor.executar_consulta()
+    return dados, consultor.diagnostico(), consultor.avisos
+
+
+def executar_particionado(periodos, ids_cursos, departamentos_filtro=None, processos=None,
+                          cursos_por_particao=CURSOS_POR_PARTICAO_PADRAO, progresso=None,
+                          requisicoes_por_segundo=REQUISICOES_POR_SEGUNDO_PADRAO,
+                          requisicoes_por_segundo_max=REQUISICOES_POR_SEGUNDO_MAX_PADRAO, **opcoes):
+    """Coleta os cursos de `ids_cursos` ({nome: id}) nos períodos, em processos paralelos.
+
+    `opcoes` são repassadas ao ConsultorQuadroHorariosUFF de cada partição. Retorna
+    (registros na ordem das partições, diagnóstico de cada partição, avisos).
+    """
+    progresso = progresso or (lambda fracao, mensagem: None)
+    particoes = particionar(periodos, list(ids_cursos), cursos_por_particao)
+    processos = max(1, min(processos or os.cpu_count() or 1, len(particoes)))
+    # O limite de requisições vale para o conjunto: cada processo fica com uma fração
+    opcoes['requisicoes_por_segundo'] = requisicoes_por_segundo / processos if requisicoes_por_segundo else 0
+    opcoes['requisicoes_por_segundo_max'] = requisicoes_por_segundo_max / processos
+
+    resultados = [None] * len(particoes)
+    diagnosticos = [None] * len(particoes)
+    avisos = []
+    progresso(0.0, f"{len(particoes)} partição(ões) em {processos} processo(s)...")
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = {
+            executor.submit(
+                _executar_particao, periodo, {curso: ids_cursos[curso] for curso in cursos},
+                departamentos_filtro, opcoes
+            ): idx
+            for idx, (periodo, cursos) in enumerate(particoes)
+        }
+        for concluidas, futuro in enumerate(as_completed(futuros), 1):
+            idx = futuros[futuro]
+            resultados[idx], diagnosticos[idx], avisos_particao = futuro.result()
+            avisos.extend(avisos_particao)
+            periodo, cursos = particoes[idx]
+            progresso(concluidas / len(particoes),
+                      f"Partição {concluidas}/{len(particoes)} concluída ({periodo[:4]}.{periodo[4]}, {len(cursos)} curso(s))")
+
+    dados = [registro for registros in resultados for registro in registros]
+    return dados, diagnosticos, avisos
@@ -0,0 +1,33 @@
+"""Cálculo de períodos letivos (formato AAAAS, ex.: 20261)."""
+
+from datetime import date
+
+
+def calcular_periodos_retroativos(periodo_base, qtd=3):
+    """Gera lista de períodos a partir de uma base."""
+    periodo_base = periodo_base.replace('.', '')
+    ano = int(periodo_base[:4])
+    semestre = int(periodo_base[4])
+    lista_periodos = []
+    for _ in range(qtd):
+        lista_periodos.append(f"{ano}{semestre}")
+        if semestre == 1:
+            semestre = 2
+            ano -= 1
+        else:
+            semestre = 1
+    return lista_periodos
+
+
+def periodo_vigente(hoje=None):
+    """Retorna o período letivo do calendário (AAAAS) para a data informada."""
+    hoje = hoje or date.today()
+    return f"{hoje.year}{1 if hoje.month <= 7 else 2}"
+
+
+def normalizar_periodo(periodo):
+    """Converte 'AAAA.S' ou 'AAAAS' em 'AAAAS'; ValueError se o formato for inválido."""
+    periodo_clean = periodo.strip().replace('.', '')
+    if len(periodo_clean) != 5 or not periodo_clean.isdigit() or periodo_clean[4] not in '12':
+        raise ValueError(f"Formato de período inválido: {periodo!r}. Use AAAA.S (ex: 2026.1)")
+    return periodo_clean
@@ -0,0 +1,64 @@
+"""Planejamento das buscas de uma consulta (menor conjunto de listagens a percorrer)."""
+
+# A partir de quantos departamentos vale mais uma busca sem filtro de departamento
+# (filtrando as turmas localmente pelo prefixo do código) do que uma busca por departamento
+LIMIAR_AGRUPAMENTO_PADRAO = 4
+
+
+class PlanoConsulta:
+    """Buscas de listagem de uma consulta e o filtro de departamentos aplicado localmente.
+
+    `buscas` é uma lista de (período, id do curso, departamento ou None, cursos), uma
+    por listagem a percorrer; cursos com o mesmo id compartilham a busca.
+    `filtro_departamentos` é None quando o próprio site já filtra os departamentos.
+    """
+
+    def __init__(self, buscas, filtro_departamentos=None):
+        self.buscas = buscas
+        self.filtro_departamentos = filtro_departamentos
+
+    def __len__(self):
+        return len(self.buscas)
+
+    def aceita(self, codigo):
+        """Indica se a turma com o código de disciplina informado entra na consulta."""
+        if self.filtro_departamentos is None or not codigo:
+            return True
+        return codigo[:3] in self.filtro_departamentos
+
+    def descrever(self, buscas_em_cache=0):
+        """Resumo legível do plano (buscas e requisições mínimas de listagem)."""
+        novas = len(self.buscas) - buscas_em_cache
+        texto = f"{len(self.buscas)} busca(s) de listagem"
+        if self.filtro_departamentos is not None:
+            texto += f" sem filtro de departamento (filtrando {', '.join(sorted(self.filtro_departamentos))} localmente)"
+        texto += f"; ao menos {novas} requisição(ões)"
+        if buscas_em_cache:
+            texto += f" ({buscas_em_cache} busca(s) já em cache)"
+        return texto
+
+
+def planejar_buscas(periodos, cursos, departamentos=None, limiar_agrupamento=LIMIAR_AGRUPAMENTO_PADRAO):
+    """Escolhe as buscas de listagem para os períodos, cursos e departamentos pedidos.
+
+    `cursos` é uma lista de (nome do curso, id do curso). Departamentos repetidos são
+    ignorados; com `limiar_agrupamento` ou mais departamentos, faz uma única busca sem
+    filtro por período e curso e filtra as turmas pelo prefixo do código.
+    """
+    deptos = sorted({d.strip().upper() for d in departamentos or [] if d and d.strip()})
+    filtro = None
+    if limiar_agrupamento and len(deptos) >= limiar_agrupamento:
+        filtro = frozenset(deptos)
+        deptos = []
+
+    cursos_por_id = {}
+    for nome, id_curso in cursos:
+        cursos_por_id.setdefault(id_curso, []).append(nome)
+
+    buscas = [
+        (periodo, id_curso, depto, nomes)
+        for periodo in periodos
+        for id_curso, nomes in cursos_por_id.items()
+        for depto in deptos or [None]
+    ]
+    return PlanoConsulta(buscas, filtro)
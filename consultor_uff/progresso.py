@@ -0,0 +1,34 @@
+"""Utilitários de acompanhamento do andamento da coleta."""
+
+import time
+
+
+class ProgressoLimitado:
+    """Repassa atualizações de andamento no máximo uma vez a cada `intervalo` segundos.
+
+    A última atualização suprimida fica pendente e é entregue por `descarregar()`,
+    para que a mensagem final de cada fase não se perca.
+    """
+
+    def __init__(self, progresso, intervalo=0.25):
+        self.progresso = progresso
+        self.intervalo = intervalo
+        self._ultima_chamada = None
+        self._pendente = None
+
+    def __call__(self, fracao, mensagem):
+        agora = time.monotonic()
+        if self._ultima_chamada is None or agora - self._ultima_chamada >= self.intervalo:
+            self._ultima_chamada = agora
+            self._pendente = None
+            self.progresso(fracao, mensagem)
+        else:
+            self._pendente = (fracao, mensagem)
+
+    def descarregar(self):
+        """Entrega a última atualização suprimida, se houver."""
+        if self._pendente is not None:
+            fracao, mensagem = self._pendente
+            self._pendente = None
+            self._ultima_chamada = time.monotonic()
+            self.progresso(fracao, mensagem)
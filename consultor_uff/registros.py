@@ -0,0 +1,60 @@
+"""Registro de uma turma em um curso e período (a linha produzida pela coleta).
+
+Em coletas de toda a universidade há centenas de milhares de registros: em vez de
+um dicionário por linha (com as chaves repetidas em cada um), cada registro é um
+objeto com __slots__, e os textos que se repetem (período, curso, departamento,
+código) são internados e compartilhados. O registro continua se comportando como
+um mapeamento somente leitura (registro['curso'], .get, dict(registro)).
+"""
+
+import sys
+from collections.abc import Mapping
+
+CAMPOS_REGISTRO = (
+    'periodo', 'curso', 'depto', 'codigo', 'disciplina', 'turma', 'horario', 'horario_bits',
+    'vagas_reg', 'vagas_vest', 'inscritos_reg', 'inscritos_vest',
+)
+CAMPOS_INTERNADOS = ('periodo', 'curso', 'depto', 'codigo')
+
+
+class RegistroTurma(Mapping):
+    """Registro imutável de uma turma; aceita os campos por nome ou como mapeamento."""
+
+    __slots__ = CAMPOS_REGISTRO
+
+    def __init__(self, periodo, curso, depto, codigo, disciplina, turma, horario, horario_bits,
+                 vagas_reg, vagas_vest, inscritos_reg, inscritos_vest):
+        atribuir = object.__setattr__
+        for campo, valor in zip(CAMPOS_REGISTRO, (periodo, curso, depto, codigo, disciplina, turma, horario,
+                                                  horario_bits, vagas_reg, vagas_vest, inscritos_reg,
+                                                  inscritos_vest)):
+            atribuir(self, campo, sys.intern(valor) if campo in CAMPOS_INTERNADOS else valor)
+
+    @classmethod
+    def de_dict(cls, dados):
+        """Registro a partir de um dicionário (ex.: lido do checkpoint); `horario_bits` é opcional."""
+        if 'horario_bits' not in dados:
+            from .horarios import codificar_horario
+            dados = {**dados, 'horario_bits': codificar_horario(dados['horario'])}
+        return cls(**{campo: dados[campo] for campo in CAMPOS_REGISTRO})
+
+    def __setattr__(self, campo, valor):
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __getitem__(self, campo):
+        if campo not in CAMPOS_REGISTRO:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def __iter__(self):
+        return iter(CAMPOS_REGISTRO)
+
+    def __len__(self):
+        return len(CAMPOS_REGISTRO)
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, campo) for campo in CAMPOS_REGISTRO)
+
+    def __repr__(self):
+        campos = ', '.join(f"{campo}={getattr(self, campo)!r}" for campo in CAMPOS_REGISTRO)
+        return f"{type(self).__name__}({campos})"
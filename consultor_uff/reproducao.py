@@ -0,0 +1,226 @@
+"""Gravação e reprodução das páginas do quadro de horários (execuções sem rede).
+
+As páginas de busca e de turma baixadas por uma consulta são gravadas em um
+arquivo zip e depois servidas de volta, no próprio processo (adaptador da sessão
+do requests) ou por um servidor HTTP local, com latência e erros simulados.
+Útil para medir desempenho e comparar resultados sem acessar o app.uff.br.
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .analise import URL_BASE_PADRAO
+
+VERSAO_ARQUIVO = 1
+
+# Cabeçalhos de resposta preservados na gravação (os demais não afetam a coleta)
+CABECALHOS_GRAVADOS = ['Content-Type', 'ETag', 'Last-Modified']
+
+
+def chave_url(url):
+    """Caminho e query da URL: a mesma página, qualquer que seja o servidor."""
+    partes = urlsplit(url)
+    return partes.path + (f"?{partes.query}" if partes.query else '')
+
+
+class ArquivoPaginas:
+    """Páginas gravadas: {caminho?query: (status, cabeçalhos, conteúdo)} e metadados da consulta."""
+
+    def __init__(self, paginas=None, metadados=None):
+        self.paginas = paginas if paginas is not None else {}
+        self.metadados = metadados if metadados is not None else {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.paginas)
+
+    def obter(self, url):
+        """(status, cabeçalhos, conteúdo) da página, ou None se não foi gravada."""
+        return self.paginas.get(chave_url(url))
+
+    def guardar(self, url, status, cabecalhos, conteudo):
+        with self._lock:
+            self.paginas[chave_url(url)] = (status, dict(cabecalhos), conteudo)
+
+    @classmethod
+    def abrir(cls, caminho):
+        """Lê um arquivo gravado por `salvar`."""
+        with zipfile.ZipFile(caminho) as zf:
+            indice = json.loads(zf.read('indice.json'))
+            if indice.get('versao') != VERSAO_ARQUIVO:
+                raise ValueError(f"Versão de arquivo de páginas não suportada: {indice.get('versao')!r}")
+            paginas = {
+                chave: (info['status'], info['cabecalhos'], zf.read(info['arquivo']))
+                for chave, info in indice['paginas'].items()
+            }
+        return cls(paginas, indice.get('metadados'))
+
+    def salvar(self, caminho):
+        """Grava o arquivo zip (índice em JSON e uma entrada por página)."""
+        with self._lock:
+            paginas = dict(self.paginas)
+        indice = {'versao': VERSAO_ARQUIVO, 'metadados': self.metadados, 'paginas': {}}
+        with zipfile.ZipFile(caminho, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for chave, (status, cabecalhos, conteudo) in sorted(paginas.items()):
+                arquivo = f"paginas/{hashlib.sha1(chave.encode('utf-8')).hexdigest()}.html"
+                zf.writestr(arquivo, conteudo)
+                indice['paginas'][chave] = {'arquivo': arquivo, 'status': status, 'cabecalhos': cabecalhos}
+            zf.writestr('indice.json', json.dumps(indice, ensure_ascii=False, indent=1))
+
+
+class FalhasSimuladas:
+    """Latência fixa e uma fração de respostas 503, sorteadas com semente opcional."""
+
+    def __init__(self, latencia=0.0, taxa_erro=0.0, semente=None):
+        self.latencia = latencia
+        self.taxa_erro = taxa_erro
+        self._aleatorio = random.Random(semente)
+        self._lock = threading.Lock()
+
+    def aplicar(self):
+        """Aguarda a latência e indica se esta requisição deve falhar."""
+        if self.latencia:
+            time.sleep(self.latencia)
+        if not self.taxa_erro:
+            return False
+        with self._lock:
+            return self._aleatorio.random() < self.taxa_erro
+
+
+def responder(arquivo, url, cabecalhos_pedido, falhas=None):
+    """(status, cabeçalhos, conteúdo) que o servidor daria para a URL.
+
+    Páginas não gravadas dão 404; If-None-Match igual ao ETag gravado dá 304.
+    """
+    if falhas and falhas.aplicar():
+        return 503, {'Content-Type': 'text/plain'}, b'Falha simulada'
+    pagina = arquivo.obter(url)
+    if pagina is None:
+        return 404, {'Content-Type': 'text/plain'}, b'Pagina nao gravada'
+    status, cabecalhos, conteudo = pagina
+    etag = cabecalhos.get('ETag')
+    if etag and cabecalhos_pedido.get('If-None-Match') == etag:
+        return 304, {'ETag': etag}, b''
+    return status, cabecalhos, conteudo
+
+
+class AdaptadorGravacao(BaseAdapter):
+    """Repassa as requisições ao adaptador real e grava as respostas bem-sucedidas."""
+
+    def __init__(self, adaptador, arquivo):
+        super().__init__()
+        self.adaptador = adaptador
+        self.arquivo = arquivo
+
+    def send(self, request, **kwargs):
+        resposta = self.adaptador.send(request, **kwargs)
+        if resposta.status_code == 200:
+            cabecalhos = {nome: resposta.headers[nome] for nome in CABECALHOS_GRAVADOS if nome in resposta.headers}
+            self.arquivo.guardar(request.url, resposta.status_code, cabecalhos, resposta.content)
+        return resposta
+
+    def close(self):
+        self.adaptador.close()
+
+
+class AdaptadorReproducao(BaseAdapter):
+    """Serve as páginas gravadas no próprio processo, sem abrir conexões.
+
+    As falhas simuladas chegam como respostas 503 sem novas tentativas (o Retry do
+    urllib3 só atua em conexões reais; use o ServidorReproducao para exercitá-lo).
+    """
+
+    def __init__(self, arquivo, falhas=None):
+        super().__init__()
+        self.arquivo = arquivo
+        self.falhas = falhas
+
+    def send(self, request, **kwargs):
+        status, cabecalhos, conteudo = responder(self.arquivo, request.url, request.headers, self.falhas)
+        resposta = requests.Response()
+        resposta.status_code = status
+        resposta.headers = CaseInsensitiveDict(cabecalhos)
+        resposta.encoding = get_encoding_from_headers(resposta.headers)
+        resposta._content = conteudo
+        resposta.url = request.url
+        resposta.request = request
+        resposta.connection = self
+        return resposta
+
+    def close(self):
+        pass
+
+
+class ServidorReproducao:
+    """Servidor HTTP local (em uma thread) que serve as páginas gravadas.
+
+    Uso: `with ServidorReproducao(arquivo, latencia=0.05) as servidor:` e passar
+    `base_url=servidor.url` ao ConsultorQuadroHorariosUFF.
+    """
+
+    def __init__(self, arquivo, latencia=0.0, taxa_erro=0.0, semente=None, porta=0):
+        falhas = FalhasSimuladas(latencia, taxa_erro, semente)
+
+        class Tratador(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                status, cabecalhos, conteudo = responder(arquivo, self.path, self.headers, falhas)
+                self.send_response(status)
+                for nome, valor in cabecalhos.items():
+                    self.send_header(nome, valor)
+                self.send_header('Content-Length', str(len(conteudo)))
+                self.end_headers()
+                self.wfile.write(conteudo)
+
+            def log_message(self, formato, *args):
+                pass
+
+        self._servidor = ThreadingHTTPServer(('127.0.0.1', porta), Tratador)
+        self._servidor.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, porta = self._servidor.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    def iniciar(self):
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def parar(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.parar()
+
+
+def gravar(session, arquivo, base_url=URL_BASE_PADRAO):
+    """Passa a gravar em `arquivo` as respostas da sessão para `base_url`."""
+    session.mount(base_url, AdaptadorGravacao(session.get_adapter(base_url), arquivo))
+    return arquivo
+
+
+def reproduzir(session, arquivo, base_url=URL_BASE_PADRAO, latencia=0.0, taxa_erro=0.0, semente=None):
+    """Faz a sessão responder com as páginas de `arquivo` em vez de acessar `base_url`."""
+    session.mount(base_url, AdaptadorReproducao(arquivo, FalhasSimuladas(latencia, taxa_erro, semente)))
+    return arquivo
@@ -0,0 +1,186 @@
+"""Transporte HTTP: sessão com retentativas, limite de taxa e contadores por execução."""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+MAX_WORKERS_PADRAO = 8
+REQUISICOES_POR_SEGUNDO_PADRAO = 5.0  # taxa inicial do limitador adaptativo
+# Teto conservador (o dobro da taxa inicial) para não sobrecarregar o servidor; --rps-max eleva
+REQUISICOES_POR_SEGUNDO_MAX_PADRAO = 2 * REQUISICOES_POR_SEGUNDO_PADRAO
+REQUISICOES_POR_SEGUNDO_MIN_PADRAO = 0.5
+TIMEOUT_PADRAO = (5, 20)  # (conexão, leitura) em segundos
+MAX_TENTATIVAS_PADRAO = 4
+STATUS_RETENTATIVA = (429, 500, 502, 503, 504)
+
+
+class EstatisticasHTTP:
+    """Contadores de requisições, novas tentativas e falhas de uma execução (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.zerar()
+
+    def zerar(self):
+        with self._lock:
+            self.requisicoes = 0
+            self.retentativas = 0
+            self.falhas = 0
+
+    def registrar(self, contador, quantidade=1):
+        with self._lock:
+            setattr(self, contador, getattr(self, contador) + quantidade)
+
+    def como_dict(self):
+        with self._lock:
+            return {'requisicoes': self.requisicoes, 'retentativas': self.retentativas, 'falhas': self.falhas}
+
+
+class RetryContabilizado(Retry):
+    """Retry do urllib3 que contabiliza cada nova tentativa em um EstatisticasHTTP.
+
+    Com um limitador, cada nova tentativa (429/5xx ou erro de conexão) também reduz a taxa.
+    """
+
+    estatisticas = None
+    limitador = None
+
+    def new(self, **kw):
+        novo = super().new(**kw)
+        novo.estatisticas = self.estatisticas
+        novo.limitador = self.limitador
+        return novo
+
+    def increment(self, *args, **kwargs):
+        novo = super().increment(*args, **kwargs)  # MaxRetryError quando as tentativas se esgotam
+        if self.estatisticas:
+            self.estatisticas.registrar('retentativas')
+        if self.limitador:
+            self.limitador.penalizar()
+        return novo
+
+
+def criar_sessao(tamanho_pool=MAX_WORKERS_PADRAO, max_tentativas=MAX_TENTATIVAS_PADRAO, estatisticas=None,
+                 limitador=None):
+    """Cria uma sessão HTTP com pool de conexões dimensionado e retentativas com backoff.
+
+    Erros de conexão/leitura e respostas 429/5xx são repetidos com espera exponencial
+    com variação aleatória (respeitando Retry-After); após a última tentativa a resposta
+    de erro é devolvida normalmente para o chamador.
+    """
+    retry = RetryContabilizado(
+        total=max_tentativas,
+        connect=max_tentativas,
+        read=max_tentativas,
+        status=max_tentativas,
+        other=0,
+        redirect=5,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        status_forcelist=STATUS_RETENTATIVA,
+        backoff_factor=0.5,
+        backoff_max=30,
+        backoff_jitter=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    retry.estatisticas = estatisticas
+    retry.limitador = limitador
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(tamanho_pool, 1), max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class LimitadorAdaptativo:
+    """Balde de fichas compartilhado por todas as requisições, com taxa adaptativa (thread-safe).
+
+    A taxa começa em `requisicoes_por_segundo` e sobe enquanto as respostas chegam rápidas,
+    até `requisicoes_por_segundo_max`: 5% por resposta até a primeira redução, depois um
+    aumento fixo pequeno. Respostas 429/5xx e erros de conexão reduzem a taxa em 30%, e
+    latência bem acima da melhor observada em 15%, no máximo uma vez por segundo.
+    Taxa 0 desliga o limite.
+    """
+
+    def __init__(self, requisicoes_por_segundo=REQUISICOES_POR_SEGUNDO_PADRAO,
+                 requisicoes_por_segundo_max=REQUISICOES_POR_SEGUNDO_MAX_PADRAO,
+                 requisicoes_por_segundo_min=REQUISICOES_POR_SEGUNDO_MIN_PADRAO, rajada=2):
+        ativo = requisicoes_por_segundo and requisicoes_por_segundo > 0
+        self.taxa = float(requisicoes_por_segundo) if ativo else None
+        self.taxa_maxima = max(requisicoes_por_segundo_max or 0, self.taxa or 0)
+        self.taxa_minima = min(requisicoes_por_segundo_min, self.taxa or requisicoes_por_segundo_min)
+        self.rajada = max(1, rajada)
+        self.passo_aumento = 0.2  # req/s somados a cada resposta saudável após a primeira redução
+        self.fator_latencia = 2.0  # latência média acima de fator x a melhor média indica sobrecarga
+        self._lock = threading.Lock()
+        self._fichas = float(self.rajada)
+        self._ultimo_abastecimento = time.monotonic()
+        self._ultima_reducao = 0.0
+        self._latencia_media = None
+        self._latencia_base = None
+        self._partida_lenta = True
+        self.reducoes = 0
+
+    def _abastecer(self, agora):
+        self._fichas = min(self.rajada, self._fichas + (agora - self._ultimo_abastecimento) * self.taxa)
+        self._ultimo_abastecimento = agora
+
+    def aguardar(self):
+        """Bloqueia até que a próxima requisição possa ser feita."""
+        if self.taxa is None:
+            return
+        with self._lock:
+            self._abastecer(time.monotonic())
+            # Ficha negativa: a requisição fica reservada para quando o balde reabastecer
+            self._fichas -= 1
+            espera = -self._fichas / self.taxa if self._fichas < 0 else 0.0
+        if espera > 0:
+            time.sleep(espera)
+
+    def _reduzir(self, fator):
+        agora = time.monotonic()
+        if agora - self._ultima_reducao < 1.0:
+            return
+        self._abastecer(agora)
+        self._ultima_reducao = agora
+        self.taxa = max(self.taxa_minima, self.taxa * fator)
+        self.reducoes += 1
+        self._partida_lenta = False
+
+    def penalizar(self):
+        """Sinal de sobrecarga (429/5xx ou erro de conexão): reduz a taxa em 30%."""
+        if self.taxa is None:
+            return
+        with self._lock:
+            self._reduzir(0.7)
+
+    def registrar(self, segundos, status=None):
+        """Ajusta a taxa a partir de uma resposta (status None para erro de conexão)."""
+        if self.taxa is None:
+            return
+        if status is None or status == 429 or status >= 500:
+            self.penalizar()
+            return
+        with self._lock:
+            media = segundos if self._latencia_media is None else 0.8 * self._latencia_media + 0.2 * segundos
+            self._latencia_media = media
+            self._latencia_base = media if self._latencia_base is None else min(self._latencia_base, media)
+            if media > self.fator_latencia * self._latencia_base and media - self._latencia_base > 0.1:
+                self._reduzir(0.85)
+            elif self.taxa < self.taxa_maxima:
+                self._abastecer(time.monotonic())
+                aumento = self.taxa * 0.05 if self._partida_lenta else self.passo_aumento
+                self.taxa = min(self.taxa_maxima, self.taxa + aumento)
+
+    def como_dict(self):
+        with self._lock:
+            return {
+                'taxa_atual': round(self.taxa, 3) if self.taxa is not None else None,
+                'taxa_maxima': self.taxa_maxima if self.taxa is not None else None,
+                'reducoes': self.reducoes,
+                'latencia_media_s': round(self._latencia_media, 6) if self._latencia_media is not None else None,
+            }
@@ -0,0 +1,34 @@
+"""Páginas de benchmarks/corpus, compartilhadas pelos testes.
+
+sintetico_*.zip tem páginas geradas no formato do quadro de horários; arquivos
+capturados do app.uff.br com `python -m consultor_uff ... --gravar` colocados na
+mesma pasta entram automaticamente nos testes de análise.
+"""
+
+import os
+
+from consultor_uff.reproducao import ArquivoPaginas
+
+CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'corpus')
+CORPUS_SINTETICO = 'sintetico_2026_1.zip'
+
+
+def carregar_paginas():
+    """(nome, html) de todas as páginas 200 dos arquivos .zip do corpus."""
+    paginas = []
+    for arquivo in sorted(os.listdir(CORPUS)):
+        if arquivo.endswith('.zip'):
+            for chave, (status, _, conteudo) in sorted(ArquivoPaginas.abrir(os.path.join(CORPUS, arquivo)).paginas.items()):
+                if status == 200:
+                    paginas.append((f"{arquivo}:{chave}", conteudo.decode('utf-8')))
+    return paginas
+
+
+def abrir_corpus():
+    """O corpus sintético (consulta completa e conhecida), para reproduzir consultas."""
+    return ArquivoPaginas.abrir(os.path.join(CORPUS, CORPUS_SINTETICO))
+
+
+PAGINAS = carregar_paginas()
+TURMAS = [(nome, html) for nome, html in PAGINAS if 'Vagas Alocadas' in html]
+LISTAGENS = [(nome, html) for nome, html in PAGINAS if 'Vagas Alocadas' not in html]
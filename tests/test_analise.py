@@ -0,0 +1,30 @@
+"""Equivalência dos backends de análise sobre as páginas de benchmarks/corpus."""
+
+import pytest
+
+from consultor_uff.analise import analisar_pagina_listagem, analisar_turma_dom, parsers_disponiveis
+
+from .corpus import LISTAGENS, TURMAS
+
+sem_lxml = pytest.mark.skipif('lxml' not in parsers_disponiveis(), reason="lxml não instalado")
+
+
+def test_corpus_tem_turmas_e_buscas_paginadas():
+    assert len(TURMAS) >= 10
+    assert any('page=' in nome for nome, _ in LISTAGENS)
+
+
+@sem_lxml
+@pytest.mark.parametrize('nome,html', TURMAS, ids=[nome for nome, _ in TURMAS])
+def test_turma_lxml_igual_html_parser(nome, html):
+    resultado = analisar_turma_dom(html, 'html.parser')
+    assert resultado is not None
+    assert analisar_turma_dom(html, 'lxml') == resultado
+
+
+@sem_lxml
+@pytest.mark.parametrize('nome,html', LISTAGENS, ids=[nome for nome, _ in LISTAGENS])
+def test_listagem_lxml_igual_html_parser(nome, html):
+    links, tem_proxima, total_paginas, codigos = analisar_pagina_listagem(html, 'html.parser')
+    assert links
+    assert analisar_pagina_listagem(html, 'lxml') == (links, tem_proxima, total_paginas, codigos)
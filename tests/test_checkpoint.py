@@ -0,0 +1,75 @@
+"""Retomada de consultas interrompidas (checkpoint no cache SQLite), com as páginas do corpus."""
+
+import pytest
+
+from consultor_uff.consultor import ConsultorQuadroHorariosUFF
+from consultor_uff.periodos import calcular_periodos_retroativos
+from consultor_uff.reproducao import reproduzir
+
+from .corpus import abrir_corpus
+
+
+class Interrompida(Exception):
+    pass
+
+
+def arquivo_sem_pagina(trecho):
+    """Corpus com as páginas cujo endereço contém `trecho` removidas (passam a dar 404)."""
+    arquivo = abrir_corpus()
+    removidas = [chave for chave in arquivo.paginas if trecho in chave]
+    assert removidas
+    for chave in removidas:
+        del arquivo.paginas[chave]
+    return arquivo
+
+
+def novo_consultor(arquivo, caminho_cache):
+    metadados = arquivo.metadados
+    consultor = ConsultorQuadroHorariosUFF(
+        calcular_periodos_retroativos(metadados['periodo'], metadados['qtd']), caminho_cache=caminho_cache,
+        max_workers=1, requisicoes_por_segundo=0,
+    )
+    reproduzir(consultor.session, arquivo, consultor.base_url)
+    return consultor
+
+
+def interromper_apos(quantidade):
+    coletadas = []
+
+    def ao_coletar(registros):
+        coletadas.append(registros)
+        if len(coletadas) >= quantidade:
+            raise Interrompida()
+    return ao_coletar
+
+
+def test_busca_incompleta_nao_e_retomada_como_completa(tmp_path):
+    arquivo = arquivo_sem_pagina('idcurso_eq%5D=28&page=2')
+    caminho_cache = str(tmp_path / 'cache.sqlite3')
+
+    consultor = novo_consultor(arquivo, caminho_cache)
+    with pytest.raises(Interrompida):
+        consultor.executar_consulta(ao_coletar=interromper_apos(5))
+    assert consultor.buscas_incompletas
+
+    retomada = novo_consultor(arquivo, caminho_cache)
+    retomada.executar_consulta()
+    assert 'checkpoint.turmas_retomadas' not in retomada.metricas.como_dict()['contadores']
+    assert retomada.consulta_incompleta()
+    assert retomada.avisos
+
+
+def test_consulta_completa_e_retomada(tmp_path):
+    arquivo = abrir_corpus()
+    caminho_cache = str(tmp_path / 'cache.sqlite3')
+    esperado = novo_consultor(arquivo, None).executar_consulta()
+
+    consultor = novo_consultor(arquivo, caminho_cache)
+    with pytest.raises(Interrompida):
+        consultor.executar_consulta(ao_coletar=interromper_apos(5))
+
+    retomada = novo_consultor(arquivo, caminho_cache)
+    dados = retomada.executar_consulta()
+    assert retomada.metricas.como_dict()['contadores']['checkpoint.turmas_retomadas'] >= 5
+    assert [dict(r) for r in dados] == [dict(r) for r in esperado]
+    assert not retomada.consulta_incompleta()
@@ -0,0 +1,18 @@
+"""Validação dos argumentos da linha de comando."""
+
+import pytest
+
+from consultor_uff.cli import criar_parser
+
+
+@pytest.mark.parametrize('argumento', ['--qtd', '--workers', '--processos', '--cursos-por-particao'])
+@pytest.mark.parametrize('valor', ['0', '-1', 'x'])
+def test_quantidades_menores_que_um_sao_rejeitadas(argumento, valor, capsys):
+    with pytest.raises(SystemExit) as erro:
+        criar_parser().parse_args(['2026.1', argumento, valor])
+    assert erro.value.code == 2
+    assert argumento in capsys.readouterr().err
+
+
+def test_qtd_valida():
+    assert criar_parser().parse_args(['2026.1', '--qtd', '1']).qtd == 1
@@ -0,0 +1,47 @@
+"""Associação das linhas de "Vagas Alocadas" aos cursos da consulta."""
+
+import pytest
+
+from consultor_uff.analise import codigo_curso
+from consultor_uff.consultor import ConsultorQuadroHorariosUFF
+
+
+@pytest.mark.parametrize('curso_nome, esperado', [
+    ('028 - Química (Niterói)', '28'),
+    ('  029 -Química Industrial', '29'),
+    ('1234 - Engenharia Química', '1234'),
+    ('Química (Niterói) - 2010', None),
+    ('Química - 028', None),
+    ('28 - Química', None),
+    ('Química', None),
+])
+def test_codigo_curso_so_no_inicio(curso_nome, esperado):
+    assert codigo_curso(curso_nome) == esperado
+
+
+def linha(curso_nome, inscritos):
+    return {'curso_nome': curso_nome, 'codigo_curso': codigo_curso(curso_nome),
+            'vagas_reg': 10, 'vagas_vest': 0, 'inscritos_reg': inscritos, 'inscritos_vest': 0}
+
+
+@pytest.fixture
+def consultor():
+    return ConsultorQuadroHorariosUFF(['20261'], caminho_cache=None)
+
+
+def test_vagas_pelo_codigo(consultor):
+    vagas = [linha('029 - Química Industrial', 1), linha('028 - Química', 2)]
+    assert consultor.vagas_do_curso(vagas, 'Química')['inscritos_reg'] == 2
+    assert consultor.vagas_do_curso(vagas, 'Química Industrial')['inscritos_reg'] == 1
+
+
+def test_numero_que_nao_e_codigo_usa_o_nome(consultor):
+    vagas = [linha('Química (Niterói) - 2010', 3)]
+    assert vagas[0]['codigo_curso'] is None
+    assert consultor.vagas_do_curso(vagas, 'Química')['inscritos_reg'] == 3
+
+
+def test_codigo_desconhecido_usa_o_nome(consultor):
+    vagas = [linha('999 - Química', 4), linha('777 - Química Industrial', 5)]
+    assert consultor.vagas_do_curso(vagas, 'Química')['inscritos_reg'] == 4
+    assert consultor.vagas_do_curso(vagas, 'Química Industrial')['inscritos_reg'] == 5
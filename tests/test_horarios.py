@@ -0,0 +1,49 @@
+"""Codificação dos horários em faixas e choques entre disciplinas."""
+
+import pytest
+
+from consultor_uff.horarios import codificar_horario, conflitos_entre_disciplinas
+
+
+@pytest.mark.parametrize('a, b, chocam', [
+    ('Seg: 08:00-09:30', 'Seg: 09:30-11:00', False),
+    ('Seg: 08:00-10:00', 'Seg: 10:00-12:00', False),
+    ('Seg: 08:00-09:40', 'Seg: 09:30-11:00', True),
+    ('Seg: 08:00-10:00', 'Seg: 09:00-09:10', True),
+    ('Seg: 08:00-10:00', 'Ter: 08:00-10:00', False),
+    ('Qua: 18:00-22:00', 'Qua: 21:50-23:00', True),
+])
+def test_intervalos_semiabertos(a, b, chocam):
+    assert bool(codificar_horario(a) & codificar_horario(b)) is chocam
+
+
+def test_horario_vazio():
+    assert codificar_horario('') == 0
+    assert codificar_horario(None) == 0
+
+
+def registro(codigo, turma, horario):
+    return {'periodo': '20261', 'codigo': codigo, 'turma': turma, 'disciplina': codigo, 'horario': horario}
+
+
+def test_aulas_seguidas_nao_sao_conflito():
+    dados = [
+        registro('GQI00001', 'A1', 'Seg: 08:00-09:30'),
+        registro('GQI00002', 'A1', 'Seg: 09:30-11:00'),
+    ]
+    assert conflitos_entre_disciplinas(dados) == []
+
+
+def test_conflito_inevitavel_e_evitavel():
+    dados = [
+        registro('GQI00001', 'A1', 'Seg: 08:00-10:00'),
+        registro('GQI00002', 'A1', 'Seg: 09:00-11:00'),
+        registro('GQI00003', 'A1', 'Seg: 09:00-11:00'),
+        registro('GQI00003', 'B1', 'Ter: 09:00-11:00'),
+    ]
+    resumo = {(r['codigo_a'], r['codigo_b']): r for r in conflitos_entre_disciplinas(dados)}
+    assert set(resumo) == {('GQI00001', 'GQI00002'), ('GQI00001', 'GQI00003'), ('GQI00002', 'GQI00003')}
+    assert resumo[('GQI00001', 'GQI00002')]['inevitavel']
+    assert resumo[('GQI00001', 'GQI00003')]['combinacoes_em_conflito'] == 1
+    assert resumo[('GQI00001', 'GQI00003')]['combinacoes'] == 2
+    assert not resumo[('GQI00001', 'GQI00003')]['inevitavel']
@@ -0,0 +1,39 @@
+"""Leitura rápida das páginas de turma: mesmo resultado da árvore completa ou recurso a ela."""
+
+import glob
+import os
+
+import pytest
+
+from consultor_uff.analise import analisar_turma, analisar_turma_dom, analisar_turma_rapido
+
+from .corpus import TURMAS
+
+PASTA_PAGINAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'paginas')
+
+
+def ler(caminho):
+    with open(caminho, encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+# Páginas com marcação fora do padrão (tags sem fechamento, tabelas aninhadas, entidades, \r...)
+VARIANTES = [(os.path.basename(caminho), ler(caminho))
+             for caminho in sorted(glob.glob(os.path.join(PASTA_PAGINAS, '*.html')))]
+
+
+@pytest.mark.parametrize('nome,html', TURMAS + VARIANTES, ids=[nome for nome, _ in TURMAS + VARIANTES])
+def test_rapido_igual_dom_ou_recorre(nome, html):
+    assert analisar_turma_rapido(html) in (None, analisar_turma_dom(html, 'html.parser'))
+
+
+@pytest.mark.parametrize('nome,html', TURMAS, ids=[nome for nome, _ in TURMAS])
+def test_corpus_lido_sem_recorrer(nome, html):
+    assert analisar_turma_rapido(html) is not None
+
+
+def test_analisar_turma_avisa_quando_recorre():
+    recursos = []
+    html = dict(VARIANTES)['turma_tabela_aninhada.html']
+    assert analisar_turma(html, 'html.parser', lambda: recursos.append(1)) == analisar_turma_dom(html, 'html.parser')
+    assert recursos == [1]
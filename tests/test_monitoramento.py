@@ -0,0 +1,41 @@
+"""Varreduras do monitoramento contínuo, com as páginas do corpus."""
+
+import time
+
+from consultor_uff.consultor import ConsultorQuadroHorariosUFF
+from consultor_uff.monitoramento import MonitorTurmas
+from consultor_uff.reproducao import reproduzir
+
+from .corpus import abrir_corpus
+
+
+def test_varredura_incompleta_nao_remove_turmas():
+    arquivo = abrir_corpus()
+    consultor = ConsultorQuadroHorariosUFF([arquivo.metadados['periodo']], caminho_cache=None,
+                                           max_workers=1, requisicoes_por_segundo=0)
+    reproduzir(consultor.session, arquivo, consultor.base_url)
+    eventos = []
+    monitor = MonitorTurmas(consultor, eventos.append, intervalo_minimo=60, intervalo_varredura=6 * 3600)
+
+    monitor.varrer()
+    alvos = {link: {periodo: list(cursos) for periodo, cursos in por_periodo.items()}
+             for link, por_periodo in monitor.alvos.items()}
+    assert alvos and not consultor.buscas_incompletas
+    for link in alvos:
+        monitor.consultar(link)
+
+    # A segunda página de uma das buscas passa a dar 404
+    periodo = arquivo.metadados['periodo']
+    pagina = next(chave for chave in sorted(arquivo.paginas) if f'anosemestre_eq%5D={periodo}' in chave and '&page=2' in chave)
+    guardada = arquivo.paginas.pop(pagina)
+    monitor.varrer()
+    assert consultor.buscas_incompletas
+    assert not [evento for evento in eventos if evento['tipo'] == 'removida']
+    assert monitor.alvos == alvos
+    assert monitor._proxima_varredura - time.monotonic() <= 60
+
+    arquivo.paginas[pagina] = guardada
+    monitor.varrer()
+    assert not consultor.buscas_incompletas
+    assert monitor.alvos == alvos
+    assert monitor._proxima_varredura - time.monotonic() > 3600
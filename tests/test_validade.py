@@ -0,0 +1,19 @@
+"""Validade do cache por período: só períodos anteriores ao vigente não expiram."""
+
+import pytest
+
+from consultor_uff import consultor as modulo_consultor
+from consultor_uff.consultor import ConsultorQuadroHorariosUFF
+
+
+@pytest.fixture(autouse=True)
+def vigente_2026_2(monkeypatch):
+    monkeypatch.setattr(modulo_consultor, 'periodo_vigente', lambda: '20262')
+
+
+@pytest.mark.parametrize('periodos', [['20262'], ['20271', '20262'], ['20262', '20261']])
+def test_periodo_vigente_expira_em_qualquer_consulta(periodos):
+    consultor = ConsultorQuadroHorariosUFF(periodos, caminho_cache=None, ttl_periodo_atual=3600)
+    assert consultor.validade_cache('20262') == 3600
+    assert consultor.validade_cache('20271') == 3600
+    assert consultor.validade_cache('20261') is None